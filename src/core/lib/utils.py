@@ -38,5 +38,5 @@ def draw_bounds(at: Surface, target_pos: ndarray, extents: ndarray,
     if fill:
         draw.polygon(at, color, points)
     else:
-        for i in range(4):
-            draw.line(at, color, points[i], points[(i + 1) % 4])
+        # Uma única chamada para o contorno fechado, no lugar de quatro `draw.line`.
+        draw.lines(at, color, True, points)
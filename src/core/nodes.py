@@ -1,23 +1,23 @@
 from abc import ABC, abstractmethod
-from functools import wraps
-from typing import Callable, Iterator, Match, Union
+from functools import cached_property, wraps
+from typing import Callable, Iterable, Iterator, Match, Union
 
 import pygame
 from pygame import Color, Surface, Vector2
 from pygame import sprite, draw, font, mouse, transform
 from pygame.locals import *
-from sys import exit, argv
+from sys import exit, argv, intern
 from os import path
 
 # Other imports
 import re
-import webbrowser
 import pytweening as tween
 from enum import IntEnum
-from math import inf, log2, sqrt
+from math import inf, sqrt
 from numpy import array, ndarray
-from numpy.linalg import norm
+from bisect import bisect_left, bisect_right
 from collections import deque
+from operator import attrgetter, methodcaller
 
 # Constants & Utils
 from .lib.vectors import *
@@ -31,6 +31,15 @@ IS_DEV_MODE_ENABLED: bool = IS_DEBUG_ENABLED and '-d' in argv
 GIZMO_RADIUS: int = 2
 NONE_CALL: Callable[..., None] = lambda *args, **kwargs: None
 
+# Vetores padrão compartilhados entre os nós, em vez de alocados a cada instância.
+# São somente leitura: os setters sempre substituem o vetor, nunca o alteram "in-place".
+_ZERO_ARRAY: ndarray = array(VECTOR_ZERO)
+_ZERO_ARRAY.setflags(write=False)
+_ONE_ARRAY: ndarray = array(VECTOR_ONE)
+_ONE_ARRAY.setflags(write=False)
+_CENTER_ARRAY: ndarray = array(CENTER)
+_CENTER_ARRAY.setflags(write=False)
+
 # Inicializa os módulos do PyGame
 pygame.init()
 
@@ -74,7 +83,8 @@ def debug_method(dbg_alt: Callable = None):
 
 class InputEvent:
     '''Data-Class usada como registro de um evento de entrada no sistema do jogo.'''
-    input_type: int
+    __slots__ = ('type', 'key', 'tag', 'target')
+    type: int
     key: int
     tag: str
     target: object
@@ -88,6 +98,9 @@ class InputEvent:
 
 class Entity:
     '''Entidade básica do jogo, que contém informações de espaço (2D).'''
+    # Compartilhada por todas as entidades: cores são sempre substituídas (`set_color`),
+    # nunca alteradas no lugar, então não é preciso alocar uma por instância.
+    DEFAULT_COLOR: Color = Color(0, 185, 225, 125)
     position: ndarray
 
     class SignalNotExists(Exception):
@@ -96,7 +109,10 @@ class Entity:
     class Signal:
         '''Classe responsável por gerenciar o envio de "eventos"/ "mensagens" entre nós.
         Baseado no padrão do observador, inspirado na sua implementação no motor Godot.'''
-        owner = None
+        # Sinais são criados aos montes (ao menos um por nó), então dispensam o `__dict__`.
+        __slots__ = ('owner', 'name', '_is_emitting', '_observers', '_callbacks',
+                     '_cache_disconnections')
+        owner: object
         name: str  # Metadata # Apenas para auxiliar no debug
 
         class NotOwner(Exception):
@@ -120,6 +136,7 @@ class Entity:
                 raise Entity.Signal.AlreadyConnected
 
             self._observers[observer] = (method, args)
+            self._callbacks = list(self._observers.values())
 
         def disconnect(self, owner, observer) -> None:
             '''Desconecta o método pertencente ao nó indicado desse sinal.'''
@@ -133,6 +150,8 @@ class Entity:
             if self._observers.pop(observer, None) == None:
                 raise Entity.Signal.NotConnected
 
+            self._callbacks = list(self._observers.values())
+
         def disconnect_all(self, owner) -> None:
             for observer, _ in self._observers:
                 self.disconnect(owner, observer)
@@ -144,8 +163,10 @@ class Entity:
             os argumentos passados na emissão.'''
             self._is_emitting = True
 
-            for observer, data in self._observers.items():
-                data[0](*(data[1] + args))
+            # A lista é substituída (não alterada) ao (des)conectar, então é segura
+            # de iterar mesmo que uma chamada conecte novos observadores.
+            for method, bound_args in self._callbacks:
+                method(*bound_args, *args)
 
             self._is_emitting = False
             # Desconecta os sinais colocados na fila durante a emissão.
@@ -157,6 +178,8 @@ class Entity:
             self.name = name
             self._is_emitting: bool = False
             self._observers: dict[Entity, tuple[Callable, ]] = {}
+            # Cópia de `_observers.values()`, refeita apenas ao (des)conectar.
+            self._callbacks: list[tuple[Callable, tuple]] = []
             self._cache_disconnections: deque[tuple[Node, Node]] = deque()
 
     # Decorador
@@ -196,24 +219,24 @@ class Entity:
         if target_scale is None:
             target_scale = self.scale
 
-        target_pos = target_pos + array(self._layer.offset())
+        # Aritmética escalar: o gizmo é desenhado a cada frame, para cada nó.
+        layer_x, layer_y = self._layer.offset()
+        pos_x: float = target_pos[X] + layer_x
+        pos_y: float = target_pos[Y] + layer_y
 
         # Desenha o Gizmo
-        extents: ndarray = GIZMO_RADIUS * target_scale
+        extent_x: float = GIZMO_RADIUS * target_scale[X]
+        extent_y: float = GIZMO_RADIUS * target_scale[Y]
         draw.line(root.screen, self._color,
-                  (target_pos[X] - extents[X], target_pos[Y]),
-                  (target_pos[X] + extents[X], target_pos[Y]))
+                  (pos_x - extent_x, pos_y), (pos_x + extent_x, pos_y))
         draw.line(root.screen, self._color,
-                  (target_pos[X], target_pos[Y] - extents[Y]),
-                  (target_pos[X], target_pos[Y] + extents[Y]))
+                  (pos_x, pos_y - extent_y), (pos_x, pos_y + extent_y))
 
         if cell[X] != 0 or cell[Y] != 0:
             # Desenha as bordas da caixa delimitadora
-            extents = cell * target_scale
-
-            anchor: ndarray = array(self.anchor)
-            draw_bounds(root.screen, target_pos, extents, anchor,
-                        self.color, fill=self._debug_fill_bounds)
+            draw_bounds(root.screen, array((pos_x, pos_y)),
+                        array((cell[X] * target_scale[X], cell[Y] * target_scale[Y])),
+                        self._anchor, self._color, fill=self._debug_fill_bounds)
 
     def set_cell(self, value: tuple[int, int]) -> None:
         '''Método virtual para determinar um tamanho/ espaço customizado para a célula.'''
@@ -251,9 +274,11 @@ class Entity:
 
     def set_anchor(self, value: tuple[int, int]) -> None:
         self._anchor = array(value)
+        # Tupla em cache, para que o getter não a reconstrua a cada acesso.
+        self._anchor_tuple = tuple(self._anchor.tolist())
 
     def get_anchor(self) -> tuple[int, int]:
-        return tuple(self._anchor)
+        return self._anchor_tuple
 
     def set_scale(self, value: ndarray) -> None:
         self._scale = value
@@ -267,9 +292,10 @@ class Entity:
 
     def __init__(self, coords: tuple[int, int] = VECTOR_ZERO):
         self.position = array(coords)
-        self._scale = array(VECTOR_ONE)
-        self._anchor = array(CENTER)
-        self._color: Color = Color(0, 185, 225, 125)
+        self._scale = _ONE_ARRAY
+        self._anchor = _CENTER_ARRAY
+        self._anchor_tuple: tuple[float, float] = CENTER
+        self._color: Color = Entity.DEFAULT_COLOR
         self._debug_fill_bounds: bool = False
         self._layer: CanvasLayer = None
         self.set_can_draw_cell(IS_DEBUG_ENABLED)
@@ -308,13 +334,24 @@ class Node(Entity):
         pass
 
     pause_mode: int = PauseModes.IGNORE
+    # Árvore de debug: versão da sub-árvore, incrementada a cada mudança nos descendentes.
+    _subtree_version: int = 0
+
+    @debug_method()
+    def _touch_tree(self) -> None:
+        '''Invalida a árvore de debug da sub-árvore deste nó e de seus ancestrais.'''
+        node: Node = self
+
+        while node is not None:
+            node._subtree_version += 1
+            node = node._parent
 
     def add_child(self, node, at: int = -1) -> None:
         '''Registra um nó na árvore como filho do nó atual.'''
         if node == self or node._parent:
             raise Node.InvalidChild
 
-        if self._children_refs.get(node.name, False):
+        if node.name in self._children_refs:
             raise Node.DuplicatedChild
 
         if at == -1:
@@ -324,6 +361,7 @@ class Node(Entity):
 
         self._children_refs[node.name] = node
         node._parent = self
+        self._touch_tree()
 
         if self._is_on_tree:
             node._enter_tree()
@@ -341,6 +379,7 @@ class Node(Entity):
 
         node = self._children_refs.pop(node.name, None)
         node._parent = None
+        self._touch_tree()
 
         if self._is_on_tree:
             node._exit_tree()
@@ -381,6 +420,30 @@ class Node(Entity):
     def get_parent(self):
         return self._parent
 
+    def iter_tree(self) -> Iterator[tuple['Node', int]]:
+        '''Percorre sob demanda a sub-árvore deste nó em pré-ordem, gerando pares
+        `(nó, profundidade)`. Permite interromper buscas sem visitar a árvore inteira.'''
+        yield self, 0
+        # Cada entrada é `[filhos, próximo índice]`, avançada no lugar para visitar os irmãos
+        # da esquerda para a direita sem cópias. A profundidade é a altura da pilha.
+        stack: list[list[Union[list[Node], int]]] = [[self._children_index, 0]]
+
+        while stack:
+            entry: list[Union[list[Node], int]] = stack[-1]
+            siblings, i = entry
+
+            if i >= len(siblings):
+                stack.pop()
+                continue
+
+            entry[1] = i + 1
+            node: Node = siblings[i]
+            yield node, len(stack)
+            children: list[Node] = node._children_index
+
+            if children:
+                stack.append([children, 0])
+
     def get_global_position(self) -> tuple[int, int]:
         '''Calcula a posição do nó, considerando a hierarquia
         (posições relativas aos nós ancestrais.'''
@@ -388,10 +451,21 @@ class Node(Entity):
         if self._is_on_tree:
             return self._global_position
 
-        if self._parent:
-            return self._parent.get_global_position() + self.position
+        # Sobe até o primeiro ancestral já na árvore (ou até o topo da hierarquia),
+        # e acumula as posições relativas de volta, na mesma ordem da versão recursiva.
+        chain: list[Node] = []
+        node: Node = self
+
+        while not node._is_on_tree and node._parent:
+            chain.append(node)
+            node = node._parent
+
+        position = node._global_position if node._is_on_tree else tuple(node.position)
+
+        for node in reversed(chain):
+            position = position + node.position
 
-        return tuple(self.position)
+        return position
 
     def get_global_scale(self) -> tuple[int, int]:
         '''Calcula a escala do nó, considerando a hierarquia
@@ -400,10 +474,20 @@ class Node(Entity):
         if self._is_on_tree:
             return self._global_scale
 
-        if self._parent:
-            return self._parent.get_global_scale() * self.scale
+        # Mesmo percurso de `get_global_position`, acumulando as escalas.
+        chain: list[Node] = []
+        node: Node = self
 
-        return tuple(self.scale)
+        while not node._is_on_tree and node._parent:
+            chain.append(node)
+            node = node._parent
+
+        scale = node._global_scale if node._is_on_tree else tuple(node.scale)
+
+        for node in reversed(chain):
+            scale = scale * node.scale
+
+        return scale
 
     def _enter_tree(self) -> None:
         '''Método virtual que é chamado logo após o nó ser inserido a árvore.
@@ -431,14 +515,24 @@ class Node(Entity):
         e o deslocamento na célula (sobre seu ponto de ancoragem).'''
         super()._draw(target_pos, target_scale, offset)
 
-    def _draw_tree(self, parent_offset: ndarray = array(VECTOR_ZERO),
-                   parent_scale: ndarray = array(VECTOR_ONE)) -> None:
-        target_scale: ndarray = self.scale * parent_scale
-        target_pos: ndarray = self.position + parent_offset
-        offset: ndarray = self.get_cell() * target_scale * self.anchor
-
-        self._global_position = tuple(target_pos)
-        self._global_scale = tuple(target_scale)
+    def _draw_tree(self, parent_offset: tuple[float, float] = VECTOR_ZERO,
+                   parent_scale: tuple[float, float] = VECTOR_ONE) -> None:
+        # Aritmética escalar: para vetores de 2 elementos, alocar `ndarray`s a cada nó,
+        # em todo frame, custa mais do que as próprias operações.
+        # Lê os campos diretamente, sem passar pelas `property`s (seus getters só os retornam).
+        scale_x, scale_y = self._scale
+        pos_x, pos_y = self.position
+        cell_w, cell_h = self.get_cell()
+        anchor_x, anchor_y = self._anchor
+        scale_x *= parent_scale[X]
+        scale_y *= parent_scale[Y]
+
+        target_scale: tuple[float, float] = scale_x, scale_y
+        target_pos: tuple[float, float] = pos_x + parent_offset[X], pos_y + parent_offset[Y]
+        offset: tuple[float, float] = cell_w * scale_x * anchor_x, cell_h * scale_y * anchor_y
+
+        self._global_position = target_pos
+        self._global_scale = target_scale
         self._draw_order(target_pos, target_scale, offset)
 
     def _draw_hierarchy(self, target_pos: tuple[int, int], target_scale: tuple[float, float],
@@ -541,18 +635,44 @@ class Node(Entity):
         Primeiro as entradas são tomadas e então os desenhos são renderizados na tela.
         Logo em seguida, após a propagação nos filhos, o método `_process` é executado.'''
         global root
-        tree_pause = tree_pause | root.tree_pause | self.pause_mode
-
-        # Propaga os métodos virtuais nos nós filhos.
-        for child in self._children_index:
-            child._propagate(tree_pause)
+        # Máscaras e a árvore em variáveis locais: evitam as buscas em `IntEnum` e no
+        # escopo global a cada nó. `tree.tree_pause` ainda é lido a cada filho, já que
+        # um `_process` pode pausar a árvore no meio do percurso.
+        tree: SceneTree = root
+        STOP: int = int(Node.PauseModes.STOP)
+        TREE_PAUSED: int = int(Node.PauseModes.TREE_PAUSED)
+        CONTINUE: int = int(Node.PauseModes.CONTINUE)
+
+        # Percurso em pós-ordem com uma pilha explícita de quadros `[nó, pausa, próximo filho]`.
+        # Os filhos são lidos por índice na lista viva, como na iteração recursiva anterior,
+        # então nós inseridos ou removidos durante o processamento têm o mesmo efeito.
+        stack: list[list] = [[self, tree_pause | tree.tree_pause | self.pause_mode, 0]]
+
+        while stack:
+            frame: list = stack[-1]
+            node, node_pause, i = frame
+            children: list[Node] = node._children_index
+
+            # Propaga os métodos virtuais nos nós filhos.
+            if i < len(children):
+                frame[2] = i + 1
+                child: Node = children[i]
+                child_mode: int = child.pause_mode
+                child_pause: int = node_pause | tree.tree_pause | child_mode
+
+                if child._children_index:
+                    stack.append([child, child_pause, 0])
+                # Folhas são processadas direto, sem empilhar um quadro.
+                elif not (child_pause & STOP or
+                          child_pause & TREE_PAUSED and not child_mode & CONTINUE):
+                    child._process()
+                continue
 
-        if not (tree_pause & Node.PauseModes.STOP or
-                tree_pause & Node.PauseModes.TREE_PAUSED
-                and not(
-                    self.pause_mode & Node.PauseModes.CONTINUE)):
+            stack.pop()
 
-            self._process()
+            if not (node_pause & STOP or
+                    node_pause & TREE_PAUSED and not node.pause_mode & CONTINUE):
+                node._process()
 
     def _process(self) -> None:
         '''Método virtual para processamento de dados em cada passo/ frame.
@@ -563,6 +683,14 @@ class Node(Entity):
         self._use_y_sort = value
         self._draw_order = self._draw_y_sorted if value else self._draw_hierarchy
 
+    def set_can_draw_cell(self, value: bool) -> None:
+        super().set_can_draw_cell(value)
+
+        # Tipos sem um `_draw` próprio só desenham a célula: a renderização vai direto
+        # a ela (ou a `NONE_CALL`), sem passar pela cadeia de `super()._draw`.
+        if type(self)._draw is Node._draw:
+            self._draw = self._draw_cell
+
     def __repr__(self) -> str:
         return f'{self.name}: {type(self)}'
 
@@ -574,11 +702,15 @@ class Node(Entity):
             raise Node.EmptyName
 
         self.freed = Entity.Signal(self, 'freed')
-        self.name: str = name
+        # Nomes internados: as buscas em `_children_refs` com a mesma string
+        # resolvem por identidade, sem comparar os caracteres.
+        self.name: str = intern(name)
         self._is_on_tree: bool = False
         self._global_position: tuple[int, int] = tuple(coords)
         self._global_scale: tuple[float, float] = VECTOR_ONE
         self._current_groups: list[str] = []
+        # A lista mantém a ordem (e acesso por índice) e tolera remoções durante as
+        # iterações da propagação; o dicionário dá a busca por nome em O(1).
         self._children_index: list[Node] = []
         self._children_refs: dict[str, Node] = {}
         self._parent: Node = None
@@ -587,6 +719,8 @@ class Node(Entity):
             self._draw_hierarchy
 
     use_y_sort: bool = property(lambda self: self._use_y_sort, set_use_y_sort)
+    can_draw_cell: bool = property(
+        lambda self: self._can_draw_cell, set_can_draw_cell)
 
 
 class Camera(Node):
@@ -615,8 +749,8 @@ class Camera(Node):
                 array(self.target.get_global_position())
 
             self._camera.raw_offset -= self.target.get_cell() + \
-                (self._camera.get_cell() * array(self._camera.anchor) +
-                 self.target.get_cell() * array(self.target.anchor))
+                (self._camera.get_cell() * self._camera._anchor +
+                 self.target.get_cell() * self.target._anchor)
             self._camera.offset = int(self._camera.raw_offset.x), int(
                 self._camera.raw_offset.y)
 
@@ -710,6 +844,16 @@ class Input:
     '''Classe responsável por gerenciar eventos de entrada.'''
     _instance = None
     events: dict[int, dict[int, list[InputEvent]]] = {}
+    # Intensidade de cada eixo numa entrada diagonal normalizada.
+    DIAGONAL_STRENGTH: float = 1 / sqrt(2)
+    # Extrai o código (tecla ou botão) de cada tipo de evento suportado.
+    # TODO -> Support more PyGame event types
+    EVENT_CODE_GETTERS: dict[int, Callable[[pygame.event.Event], int]] = {
+        KEYDOWN: attrgetter('key'),
+        KEYUP: attrgetter('key'),
+        MOUSEBUTTONUP: attrgetter('button'),
+        MOUSEBUTTONDOWN: attrgetter('button'),
+    }
 
     class Mouse(IntEnum):
         LEFT_CLICK = 1
@@ -751,6 +895,18 @@ class Input:
 
         event_key.append(InputEvent(input_type, key, tag, to))
 
+    def register_events(self, to: Node, events: Iterable[tuple[int, int, str]]) -> None:
+        '''Registra, de uma só vez, vários eventos `(input_type, key, tag)` para o mesmo nó.'''
+
+        if not isinstance(to, Node):
+            raise Input.NotANode
+
+        events_types: dict[int, dict[int, list[InputEvent]]] = self.events
+
+        for input_type, key, tag in events:
+            events_types.setdefault(input_type, {}).setdefault(key, []).append(
+                InputEvent(input_type, key, tag, to))
+
     def remove_event(self, to: Node, input_type: int, key: int, tag: str = '') -> None:
 
         if not isinstance(to, Node):
@@ -787,27 +943,28 @@ class Input:
             for target_event in target_events:
                 event_key.remove(target_event)
 
-    def get_input_strength() -> ndarray:
+    def get_input_strength() -> Vector2:
         '''Método auxiliar para calcular um input axial.'''
         is_pressed = pygame.key.get_pressed()
-        keys: dict = {K_w: 0.0, K_a: 0.0, K_s: 0.0, K_d: 0.0}
-        strength: ndarray
-
-        for key in keys:
-            keys[key] = 1.0 if is_pressed[key] else 0.0
+        x: int = is_pressed[K_d] - is_pressed[K_a]
+        y: int = is_pressed[K_s] - is_pressed[K_w]
 
-        strength = array([keys[K_d] - keys[K_a], keys[K_s] - keys[K_w]])
-        strength_norm = norm(strength)
+        # Cada eixo vale -1, 0 ou 1: a norma só difere de 1 nas diagonais.
+        if x and y:
+            return Vector2(x * Input.DIAGONAL_STRENGTH, y * Input.DIAGONAL_STRENGTH)
 
-        if strength_norm:
-            strength /= strength_norm
-
-        return strength
+        return Vector2(x, y)
 
     def _tick(self) -> bool:
         '''Passo de captura dos inputs, mapeando-os nos eventos e executando-os.
         Se alguma entrada tiver ocorrido retorna `true`, ou então `falso` caso ocioso.'''
+        global root
         input_events = pygame.event.get()
+        # Posição do mouse em cache, válida durante todo o frame (inclusive nos eventos).
+        # Consultada logo após a coleta dos eventos, que atualiza o estado do mouse.
+        root._mouse_pos = mouse.get_pos()
+        get_event_type: Callable[[int], dict] = self.events.get
+        get_code_getter: Callable[[int], Callable] = Input.EVENT_CODE_GETTERS.get
 
         for event in input_events:
 
@@ -815,17 +972,15 @@ class Input:
                 pygame.quit()
                 exit()
 
-            event_type: dict = self.events.get(event.type, False)
+            event_type: dict = get_event_type(event.type)
             if not event_type:
                 continue
 
-            # TODO -> Support more PyGame event types
-            event_code: int = {
-                KEYDOWN: lambda e: e.key,
-                KEYUP: lambda e: e.key,
-                MOUSEBUTTONUP: lambda e: e.button,
-                MOUSEBUTTONDOWN: lambda e: e.button,
-            }.get(event.type)(event)
+            code_getter: Callable[[pygame.event.Event], int] = get_code_getter(event.type)
+            if code_getter is None:
+                continue
+
+            event_code: int = code_getter(event)
 
             if event_code is None:
                 continue
@@ -881,18 +1036,22 @@ class Tween():
         QUART: Callable = tween.easeOutQuart
         QUINT: Callable = tween.easeOutQuint
 
+    __slots__ = ('tween_finished', 'target', 'name', 'ease_method', 'from_value', 'to_value',
+                 '_values_diff', 'duration', '_elapsed_time', '_interpolate',
+                 '_from_x', '_from_y', '_diff_x', '_diff_y')
     tween_finished: Entity.Signal
 
     target: Node
-    name: str = ''
-    ease_method: Callable = None
+    name: str
+    ease_method: Callable
 
-    from_value = None
-    to_value = None
-    _values_diff = None
+    from_value: object
+    to_value: object
+    _values_diff: object
 
-    duration: float = 0.0
-    _elapsed_time: float = 0.0
+    duration: float
+    _elapsed_time: float
+    _interpolate: Callable[[float], object]
 
     def _process(self, delta: float) -> None:
         '''Process the easing method.'''
@@ -900,14 +1059,28 @@ class Tween():
 
         if self._elapsed_time > self.duration:
             setattr(self.target, self.name, self.to_value)
-            root._active_tweens.remove(self)
+            del root._active_tweens[self]
             self.tween_finished.emit()
             return
 
         time_factor: float = self._elapsed_time / self.duration
-        plot: float = self.ease_method(time_factor)
-        new_value = self._values_diff * plot + self.from_value
-        setattr(self.target, self.name, new_value)
+        setattr(self.target, self.name, self._interpolate(self.ease_method(time_factor)))
+
+    def _interpolate_value(self, plot: float):
+        '''Interpolação genérica, para qualquer tipo que aceite operações aritméticas.'''
+        return self._values_diff * plot + self.from_value
+
+    def _interpolate_scalar(self, plot: float) -> float:
+        '''Interpolação de escalares nativos, sem despacho para `ndarray`.'''
+        return self._from_x + self._diff_x * plot
+
+    def _interpolate_pair(self, plot: float) -> tuple[float, float]:
+        '''Interpolação de tuplas 2D, feita por componente.'''
+        return self._from_x + self._diff_x * plot, self._from_y + self._diff_y * plot
+
+    def _interpolate_vector(self, plot: float) -> ndarray:
+        '''Interpolação de vetores 2D, feita por componente para alocar um único `ndarray`.'''
+        return array((self._from_x + self._diff_x * plot, self._from_y + self._diff_y * plot))
 
     def interpolate_attribute(self, name: str, from_value, to_value, duration: float,
                               ease_method: Callable = EaseInOut.SINE) -> None:
@@ -927,12 +1100,32 @@ class Tween():
         self.name = name
         self.from_value = from_value
         self.to_value = to_value
-        self._values_diff = to_value - from_value
+
+        # Escolhe a interpolação pelo tipo uma única vez, fora do passo por frame.
+        if type(from_value) in (int, float) and type(to_value) in (int, float):
+            self._from_x, self._diff_x = from_value, to_value - from_value
+            self._interpolate = self._interpolate_scalar
+        elif type(from_value) is tuple and type(to_value) is tuple and \
+                len(from_value) == len(to_value) == 2:
+            self._from_x, self._from_y = from_value
+            self._diff_x, self._diff_y = to_value[X] - from_value[X], to_value[Y] - from_value[Y]
+            self._interpolate = self._interpolate_pair
+        else:
+            self._values_diff = to_value - from_value
+
+            if isinstance(self._values_diff, ndarray) and self._values_diff.shape == (2,):
+                # Componentes como `float`s nativos, mais rápidos que escalares do numpy.
+                self._from_x, self._from_y = array(from_value).tolist()
+                self._diff_x, self._diff_y = self._values_diff.tolist()
+                self._interpolate = self._interpolate_vector
+            else:
+                self._interpolate = self._interpolate_value
 
         self.duration = duration
         self.ease_method = ease_method
+        # Registra antes do primeiro passo, que pode já concluir o tween.
+        root._active_tweens[self] = None
         self._process(root.delta)
-        root._active_tweens.append(self)
 
     # TODO -> `interpolate_method()`
     # def interpolate_method(self, name: str, from_args: tuple = (), to_args: tuple = (),
@@ -942,12 +1135,22 @@ class Tween():
     def __init__(self, target: Node) -> None:
         self.target = target
         self.tween_finished = Entity.Signal(self, 'tween_finished')
+        self.name = ''
+        self.ease_method = None
+        self.from_value = None
+        self.to_value = None
+        self._values_diff = None
+        self.duration = 0.0
+        self._elapsed_time = 0.0
 
 
 class Timer():
     '''Helper class to create time-sensitive events.'''
+    # Temporizadores são criados a cada ataque/ dano e processados a cada frame,
+    # então dispensam o `__dict__`.
+    __slots__ = ('timeout', 'elapsed_time', 'target_time')
     timeout: Node.Signal
-    elapsed_time: float = 0.0
+    elapsed_time: float
     target_time: float
 
     def _process(self, delta: float) -> None:
@@ -957,6 +1160,7 @@ class Timer():
             self.timeout.emit(self)
 
     def __init__(self, time: int) -> None:
+        self.elapsed_time = 0.0
         self.target_time = time
         self.timeout = Entity.Signal(self, 'timeout')
 
@@ -965,10 +1169,13 @@ class Control(Node):
     '''Nó Base para subtipos de Interface Gráfica do Usuário (GUI).'''
 
     def get_cell(self) -> tuple[int, int]:
-        return self.size
+        return self._cell
 
     def set_size(self, value: tuple[int, int]) -> None:
         self._size = array(value)
+        # A célula é lida várias vezes por frame (layout e desenho), então
+        # a conversão de `get_size` é feita apenas quando o tamanho muda.
+        self._cell = self.get_size()
 
     def get_size(self) -> tuple[int, int]:
         return tuple(self._size)
@@ -976,8 +1183,9 @@ class Control(Node):
     def __init__(self, name: str = 'Control', coords: tuple[int, int] = VECTOR_ZERO,
                  anchor: tuple[int, int] = TOP_LEFT) -> None:
         super().__init__(name=name, coords=coords)
-        self.anchor = array(anchor)
-        self._size: ndarray = array(VECTOR_ZERO)
+        self.anchor = anchor
+        self._size: ndarray = _ZERO_ARRAY
+        self._cell: tuple[int, int] = self.get_size()
 
     size: tuple[int, int] = property(get_size, set_size)
 
@@ -1007,20 +1215,22 @@ class Grid(Control):
         return node
 
     def update_container(self) -> None:
-        current_pos: ndarray = array(VECTOR_ZERO)
+        # Acumula em escalares; cada filho recebe o seu próprio `ndarray` de posição.
+        x, y = VECTOR_ZERO
+        cell_width, cell_height = self.cell_space
+        rows: int = self._rows
         counter: int = 0
 
         for child in self._children_index:
-            child.position = current_pos
+            child.position = array((x, y))
             counter += 1
-            current_pos = array(current_pos)
 
-            if counter < self.rows:
-                current_pos[X] += self.cell_space[X]
+            if counter < rows:
+                x += cell_width
             else:
                 counter = 0
-                current_pos[X] = 0
-                current_pos[Y] += self.cell_space[Y]
+                x = 0
+                y += cell_height
 
     def set_rows(self, value: int) -> None:
         self._rows = value
@@ -1050,7 +1260,7 @@ class HBox(Control):
     def add_child(self, node: Node, at: int = -1) -> None:
         super().add_child(node, at=at)
         new_offset: ndarray = (array(node.get_cell()) + (self.padding[X], self.padding[Y]) + (
-            self.padding[W], self.padding[H])) * self.anchor
+            self.padding[W], self.padding[H])) * self._anchor
 
         self._rect_offset = self._rect_offset[X] + new_offset[X], max(
             self._rect_offset[Y], new_offset[Y])
@@ -1096,7 +1306,7 @@ class VBox(Control):
     def add_child(self, node: Node, at: int = -1) -> None:
         super().add_child(node, at=at)
         new_offset: ndarray = (array(node.get_cell()) + (self.padding[X], self.padding[Y]) + (
-            self.padding[W], self.padding[H])) * self.anchor
+            self.padding[W], self.padding[H])) * self._anchor
 
         self.size = max(
             self.size[X], new_offset[X]), self.size[Y] + new_offset[Y]
@@ -1144,15 +1354,8 @@ class TextureSequence:
                         coords: tuple[int, int] = VECTOR_ZERO,
                         sprite_size: tuple[int, int] = None) -> None:
         '''Realiza o fatiamento da textura de uma spritesheet como a sequencia de sprites.'''
-
-        if sprite_size is None:
-            sprite_size = (texture.get_width() / h_slice,
-                           texture.get_height() / v_slice)
-
-        for i in range(h_slice):
-            for j in range(v_slice):
-                self._textures.append(texture.subsurface(
-                    array(coords) + (i, j) * array(sprite_size), sprite_size))
+        self._textures.extend(Icon.get_spritesheet(
+            texture, h_slice, v_slice, coords, sprite_size))
 
     def add_texture(self, *paths: str) -> None:
 
@@ -1178,7 +1381,9 @@ class TextureSequence:
 
 class BaseAtlas(sprite.Sprite):
     '''Classe do PyGame responsável por gerenciar sprites e suas texturas.'''
-    base_size: ndarray
+    # Cobre o ciclo da maior animação das spritesheets (6 quadros) com folga.
+    SCALE_CACHE_SIZE: int = 8
+    base_size: tuple[int, int]
     rect: Rect
     image: Surface
 
@@ -1198,12 +1403,45 @@ class BaseAtlas(sprite.Sprite):
         """Atualiza a imagem para uma textura base rotacionada mantendo o seu centro."""
         # TODO -> Permitir a mudança do ponto âncora.
         rect: Rect = base_texture.get_rect()
-
-        self._base_rect = rect
         self._angle = angle
-        self.image = pygame.transform.rotate(base_texture, angle)
-        self.rect = self.image.get_rect(center=rect.center)
-        self.base_size = array(base_texture.get_size())
+
+        if angle:
+            self.image = pygame.transform.rotate(base_texture, angle)
+            self.rect = self.image.get_rect(center=rect.center)
+        else:
+            # Sem rotação, a textura (uma subsuperfície da spritesheet) é usada diretamente:
+            # trocar de quadro não copia os pixels nem aloca um novo `Rect`.
+            self.image = base_texture
+            self.rect = rect
+
+        self.base_size = rect.size
+        self._unscaled_image = self.image
+
+    def get_scaled(self, size: tuple[int, int]) -> Surface:
+        '''Retorna a imagem atual reescalada para `size`.
+        As escalas recentes de cada textura base (virada e rotacionada) ficam em um cache
+        LRU, então as animações não refazem a transformação a cada troca de quadro.'''
+        # Sempre escala a partir da imagem original, nunca de uma já reescalada.
+        unscaled: Surface = self._unscaled_image
+
+        if unscaled.get_size() == size:
+            return unscaled
+
+        cache: dict[tuple, Surface] = self._scale_cache
+        key: tuple = (self._base_texture, self._flip_h, self._angle, size)
+        image: Surface = cache.pop(key, None)
+
+        if image is None:
+            image = transform.scale(unscaled, size)
+
+            if len(cache) >= BaseAtlas.SCALE_CACHE_SIZE:
+                # Descarta a entrada usada há mais tempo (a primeira inserida).
+                del cache[next(iter(cache))]
+
+        # (Re)insere no fim: o dicionário mantém a ordem de uso.
+        cache[key] = image
+
+        return image
 
     def set_flip(self, value: bool) -> None:
         self._flip_h = value
@@ -1219,11 +1457,12 @@ class BaseAtlas(sprite.Sprite):
 
     def __init__(self) -> None:
         super().__init__()
-        self.base_size = array(VECTOR_ZERO)
+        self.base_size = VECTOR_ZERO
         self._flip_h: bool = False
         self._angle: float = 0.0
-        self._base_rect: Rect = None
         self._base_texture: Surface = None
+        self._unscaled_image: Surface = None
+        self._scale_cache: dict[tuple, Surface] = {}
 
     flip_h: bool = property(
         lambda _self: _self._flip_h, set_flip)
@@ -1244,18 +1483,17 @@ class Icon(BaseAtlas):
                         coords: tuple[int, int] = VECTOR_ZERO,
                         sprite_size: tuple[int, int] = None) -> list[Surface]:
         '''Realiza o fatiamento da textura de uma spritesheet como uma sequencia de surfaces.'''
-        sheet: list[Surface] = []
-
         if sprite_size is None:
             sprite_size = (texture.get_width() / h_slice,
                            texture.get_height() / v_slice)
 
-        for i in range(h_slice):
-            for j in range(v_slice):
-                sheet.append(texture.subsurface(array(coords) +
-                             (i, j) * array(sprite_size), sprite_size))
+        # Coordenadas escalares: evita alocar `ndarray`s a cada fatia.
+        x, y = coords
+        width, height = sprite_size
+        subsurface: Callable[..., Surface] = texture.subsurface
 
-        return sheet
+        return [subsurface((x + i * width, y + j * height), sprite_size)
+                for i in range(h_slice) for j in range(v_slice)]
 
     def set_texture(self, id: int) -> None:
         self.texture_id = id
@@ -1270,11 +1508,10 @@ class Icon(BaseAtlas):
 class Atlas(BaseAtlas, ABC):
     _is_static: bool = True
     _is_paused: bool = False
-    _play: Callable[[], None] = NONE_CALL
     _current_time: float = 0.0
-
-    def update(self) -> None:
-        self._play()
+    # Estratégia de reprodução, atribuída por instância (`NONE_CALL`, `_play_sequence`
+    # ou `_play_once`): o `Sprite` a chama diretamente a cada frame, sem um intermediário.
+    update: Callable[[], None] = NONE_CALL
 
     @abstractmethod
     def _play_sequence(self) -> None:
@@ -1289,7 +1526,7 @@ class Atlas(BaseAtlas, ABC):
         self._reset_play()
 
     def _reset_play(self) -> None:
-        self._play = NONE_CALL if self._is_static or self._is_paused else self._play_sequence
+        self.update = NONE_CALL if self._is_static or self._is_paused else self._play_sequence
 
     @abstractmethod
     def get_frame(self) -> int:
@@ -1312,15 +1549,22 @@ class AtlasPage(Atlas):
 
     def _play_sequence(self) -> None:
         global root
-        self._current_time = (
-            self._current_time + self.sequence.speed * root.delta)\
-            % self.sequence.get_frames()
-        new_frame: int = int(self._current_time)
+        sequence: TextureSequence = self.sequence
+        frames: int = sequence.get_frames()
+        current_time: float = self._current_time + sequence.speed * root.delta
+
+        # O módulo só é necessário ao dar a volta na sequência.
+        if not 0.0 <= current_time < frames:
+            current_time %= frames
 
-        if new_frame != self.sequence.frame:
+        self._current_time = current_time
+        frame: int = sequence.frame
+
+        # Só converte o tempo em quadro ao cruzar a fronteira do quadro atual.
+        if not frame <= current_time < frame + 1:
             # WATCH -> Prevenir frame skip?
-            self.sequence.frame = new_frame
-            self.set_base_texture(self.sequence.get_texture())
+            sequence.frame = int(current_time)
+            self.set_base_texture(sequence.get_texture())
 
     def _update_frame(self) -> None:
 
@@ -1335,7 +1579,7 @@ class AtlasPage(Atlas):
             self._is_static = False
 
             if not self._is_paused:
-                self._play = self._play_sequence
+                self.update = self._play_sequence
 
         self._update_frame()
 
@@ -1350,7 +1594,7 @@ class AtlasPage(Atlas):
             self._is_static = False
 
             if not self._is_paused:
-                self._play = self._play_sequence
+                self.update = self._play_sequence
 
         self._update_frame()
 
@@ -1397,15 +1641,22 @@ class AtlasBook(Atlas):
     def _play_sequence(self) -> None:
         '''Processamento dos quadros da animação.'''
         global root
-        self._current_time = (
-            self._current_time + self._current_sequence.speed *
-            root.delta) % self._current_sequence.get_frames()
-        new_frame: int = int(self._current_time)
+        sequence: TextureSequence = self._current_sequence
+        frames: int = sequence.get_frames()
+        current_time: float = self._current_time + sequence.speed * root.delta
+
+        # O módulo só é necessário ao dar a volta na sequência.
+        if not 0.0 <= current_time < frames:
+            current_time %= frames
 
-        if new_frame != self._current_sequence.frame:
+        self._current_time = current_time
+        frame: int = sequence.frame
+
+        # Só converte o tempo em quadro ao cruzar a fronteira do quadro atual.
+        if not frame <= current_time < frame + 1:
             # WATCH -> Prevenir frame-skip?
-            self._current_sequence.frame = new_frame
-            self.set_base_texture(self._current_sequence.get_texture())
+            sequence.frame = int(current_time)
+            self.set_base_texture(sequence.get_texture())
 
     def _update_frame(self) -> None:
         '''Método auxiliar para atualizar um frame da animação.'''
@@ -1459,7 +1710,7 @@ class AtlasBook(Atlas):
         self._current_sequence = self.animations[name]
         self._current_sequence.frame = int(from_time)
         self._owner = owner
-        self._play = self._play_once
+        self.update = self._play_once
         self._update_frame()
         self._time_events = time_events
         self._next_time_event()
@@ -1479,7 +1730,7 @@ class AtlasBook(Atlas):
             self._is_static = False
 
             if not self._is_paused:
-                self._play = self._play_sequence
+                self.update = self._play_sequence
 
         self._update_frame()
 
@@ -1552,19 +1803,29 @@ class Sprite(Node):
     def _draw(self, target_pos: tuple[int, int], target_scale: tuple[float, float],
               offset: tuple[int, int]) -> None:
         global root
-        super()._draw(target_pos, target_scale, offset)
+        # Equivalente a `super()._draw`, sem percorrer a cadeia de chamadas a cada sprite.
+        self._draw_cell(target_pos, target_scale, offset)
 
         # REFACTOR -> Fazer as transforms serem recalculadas _JIT_ (Just In Time).
-        self.atlas.image = pygame.transform.scale(
-            self.atlas.image, (self.atlas.base_size * target_scale).astype('int'))
-        self.atlas.rect.topleft = array(target_pos) - offset
+        atlas: BaseAtlas = self.atlas
+        base_width, base_height = atlas.base_size
+        size: tuple[int, int] = (
+            int(base_width * target_scale[X]), int(base_height * target_scale[Y]))
+
+        # Reescalar para o mesmo tamanho apenas copia a imagem: só refaz quando muda.
+        if atlas.image.get_size() != size:
+            atlas.image = atlas.get_scaled(size)
+
+        rect: Rect = atlas.rect
+        rect.topleft = (target_pos[X] - offset[X], target_pos[Y] - offset[Y])
+        layer_x, layer_y = self._layer.offset()
 
         # Draw sprite in order
-        root.screen.blit(self.atlas.image, Rect(array(
-            self.atlas.rect.topleft) + self._layer.offset(), self.atlas.rect.size))
+        root.screen.blit(atlas.image, (rect.x + layer_x, rect.y + layer_y))
 
-    def get_cell(self) -> ndarray:
-        return array(self.atlas.base_size)
+    def get_cell(self) -> tuple[int, int]:
+        # A árvore só lê a célula a cada frame: dispensa a cópia em um `ndarray`.
+        return self.atlas.base_size
 
     def __init__(self, name: str = 'Sprite', coords: tuple[int, int] = VECTOR_ZERO,
                  atlas: BaseAtlas = None) -> None:
@@ -1599,12 +1860,17 @@ class Shape(Node):
 
     def _draw(self, target_pos: tuple[int, int], target_scale: tuple[float, float],
               offset: tuple[int, int]) -> None:
-        super()._draw(target_pos, target_scale, offset)
-        self._rect.size = self._base_size * target_scale
-        self._rect.topleft = array(target_pos) - offset
+        # Equivalente a `super()._draw`, sem percorrer a cadeia de chamadas a cada forma.
+        self._draw_cell(target_pos, target_scale, offset)
+        # Atribuições separadas: ao contrário de `Rect.update` (que trunca), arredondam os floats.
+        rect: Rect = self._rect
+        base_size: ndarray = self._base_size
+        rect.size = (base_size[X] * target_scale[X], base_size[Y] * target_scale[Y])
+        rect.topleft = (target_pos[X] - offset[X], target_pos[Y] - offset[Y])
 
     def get_cell(self) -> ndarray:
-        return array(self._base_size)
+        # Sem cópia: a célula é apenas lida (desenho e layout) a cada frame.
+        return self._base_size
 
     def set_rect(self, value: Rect) -> None:
         self.base_size = array(value.size)
@@ -1699,11 +1965,13 @@ class VisibilityNotifier(Shape):
     def _draw(self, target_pos: tuple[int, int],
               target_scale: tuple[float, float], offset: tuple[int, int]) -> None:
         global root
-        super()._draw(target_pos, target_scale, offset)
+        # Chamada direta: `Shape._draw` já dispensa o restante da cadeia de `super()._draw`.
+        Shape._draw(self, target_pos, target_scale, offset)
 
         is_colliding: bool = self._rect.colliderect(root._screen_rect)
 
-        if is_colliding != self.is_on_screen:
+        # Os sinais só são emitidos quando o estado muda.
+        if is_colliding is not self.is_on_screen:
             self._shift(is_colliding)
 
     def shift_on_screen(self, _to: bool = None) -> None:
@@ -1751,8 +2019,8 @@ class TileMap(Node):
               offset: tuple[int, int]) -> None:
         global root
         super()._draw(target_pos, target_scale, offset)
-        root.screen.blit(self._map_scaled, Rect(
-            self._layer.offset(), self._map_scaled.get_size()))
+        # O `blit` só usa a posição do destino: dispensa um `Rect` novo a cada frame.
+        root.screen.blit(self._map_scaled, self._layer.offset())
 
     def screen_to_map(self, x: int, y: int) -> tuple[int, int]:
         '''Converte uma posição na tela em um ponto do mapa.'''
@@ -1777,8 +2045,7 @@ class TileMap(Node):
             # Grow X
             diff: int = col - last_column
 
-            for i in range(diff):
-                self.grid.append([])
+            self.grid.extend([] for _ in range(diff))
 
             self.width = len(self.grid)
             self._map = Surface(array(self.get_size()) *
@@ -1790,8 +2057,7 @@ class TileMap(Node):
         if last_row < row:
             diff: int = row - last_row
 
-            for j in range(diff):
-                row_tiles.append(None)
+            row_tiles.extend([None] * diff)
 
             # Grow Y
             new_height: int = len(row_tiles)
@@ -1804,8 +2070,9 @@ class TileMap(Node):
         row_tiles[row] = len(self.tiles)
         self.tiles.append(tile)
 
-        tile.rect.topleft = (
-            self._tile_size * self._global_scale).astype('int') * (col, row)
+        tile_width, tile_height = self._tile_size
+        scale_x, scale_y = self._global_scale
+        tile.rect.topleft = (int(tile_width * scale_x) * col, int(tile_height * scale_y) * row)
 
     def get_tile(self, col: int, row: int) -> _Tile:
         tile: Icon
@@ -1840,11 +2107,10 @@ class TileMap(Node):
         row_tiles[row] = None
 
         if tile:
-            tile_coord: tuple[int, int] = self._tile_size * (col, row)
-
-            for x in range(tile_coord[X], tile_coord[X] + self._tile_size[X]):
-                for y in range(tile_coord[Y], tile_coord[Y] + self._tile_size[Y]):
-                    self._map.set_at((x, y), colors.TRANSPARENT)
+            tile_width, tile_height = self._tile_size
+            # Limpa a área da célula de uma vez, em C (sem `set_at` por pixel).
+            self._map.fill(colors.TRANSPARENT, (
+                int(tile_width) * col, int(tile_height) * row, tile_width, tile_height))
 
         while row_tiles:
             if row_tiles[-1] is None:
@@ -1904,8 +2170,15 @@ class TileMap(Node):
                 tile.rect.size = tuple(self._tile_size)
 
         for tile in self.tiles:
-            tile.image.set_alpha()
-            self._map.blit(tile.image, tile.rect)
+            image: Surface = tile.image
+
+            # A imagem pode ser a textura compartilhada (subsuperfície da spritesheet):
+            # a transparência global é removida numa cópia, sem afetar os demais tiles.
+            if image.get_alpha() not in (None, 255):
+                image = image.copy()
+                image.set_alpha(None)
+
+            self._map.blit(image, tile.rect)
 
         self._update_scaled_map()
 
@@ -1937,9 +2210,9 @@ class Panel(Control):
         value = array(value)
         self.borders.base_size = value
 
-        self._inner_size = value - \
-            (array((self._borders[X], self._borders[Y])
-                   ) + (self._borders[W], self._borders[H]))
+        # As margens de cada eixo são somadas em escalares, sem vetores intermediários.
+        borders: tuple[int, int, int, int] = self._borders
+        self._inner_size = value - (borders[X] + borders[W], borders[Y] + borders[H])
         self.bg.base_size = self._inner_size
 
     def get_size(self) -> ndarray:
@@ -1950,7 +2223,7 @@ class Panel(Control):
         self.bg.anchor = value
         self.borders.anchor = value
         self.bg.position = array(
-            (self._borders[X], self._borders[Y])) * self.bg.anchor
+            (self._borders[X], self._borders[Y])) * self.bg._anchor
         # self.set_size(self._size) # Updates
 
     def __init__(self, name: str = 'Panel', coords: tuple[int, int] = VECTOR_ZERO,
@@ -1959,18 +2232,19 @@ class Panel(Control):
                  borders: tuple[int, int, int, int] = DEFAULT_BORDERS) -> None:
         super().__init__(name=name, coords=coords, anchor=anchor)
         self._size = array(size)
+        self._cell = self._size
         self._borders: tuple[int, int, int, int] = borders
 
         # Determina o tamanho do retângulo interno (BackGround)
         topleft: ndarray = array((borders[X], borders[Y]))
-        base_size: ndarray = size - (topleft + (borders[W], borders[H]))
+        base_size: ndarray = array(size) - (borders[X] + borders[W], borders[Y] + borders[H])
         self._inner_size: ndarray = base_size
         # offset: ndarray = array(self.get_cell()) * - self.anchor
 
         # Set the border square
         bar: Shape = Shape(name='Borders')
         bar.color = borders_color
-        bar.anchor = array(TOP_LEFT)
+        bar.anchor = TOP_LEFT
         bar.rect = Rect(VECTOR_ZERO, size)
         bar.can_draw_cell = True
         self.borders = bar
@@ -1978,7 +2252,7 @@ class Panel(Control):
 
         # Set the BackGround
         bar: Shape = Shape(name='BG', coords=topleft)
-        bar.anchor = array(TOP_LEFT)
+        bar.anchor = TOP_LEFT
         bar.color = bg_color
         bar.rect = Rect(topleft, base_size)
         bar.can_draw_cell = True
@@ -1995,15 +2269,19 @@ class ProgressBar(Panel):
 
     def _update_progress(self, value: float) -> None:
         '''Atualiza o tamanho da barra de progresso de forma ascendente.'''
-        self.bar.base_size[self._grow_coord] = self._inner_size[self._grow_coord] * value
+        self.bar.base_size[self._grow_coord] = self._inner_extent * value
 
     def _update_progress_flip(self, value: float) -> None:
         '''Atualiza o tamanho da barra de progresso de forma descendente.'''
-        base_size: int = self._inner_size[self._grow_coord]
-        length: int = base_size * value
+        length: float = self._inner_extent * value
 
-        self.bar.position[self._grow_coord] = base_size - length
-        self.bar.base_size[self._grow_coord] = self._inner_size[self._grow_coord] * value
+        self.bar.position[self._grow_coord] = self._inner_extent - length
+        self.bar.base_size[self._grow_coord] = length
+
+    def set_size(self, value: ndarray) -> None:
+        super().set_size(value)
+        # Extensão interna no eixo de crescimento, lida a cada atualização do progresso.
+        self._inner_extent: int = self._inner_size[self._grow_coord].item()
 
     def _filter_progress(self, value: float) -> float:
         return clamp(0.0, value, 1.0)
@@ -2024,10 +2302,10 @@ class ProgressBar(Panel):
         super().__init__(name=name, coords=coords, bg_color=bg_color,
                          borders_color=borders_color, size=size, borders=borders)
         self.color = bg_color
+        self._grow_coord: int = int(v_grow)
         self.size = size
 
         self._progress: float = progress
-        self._grow_coord: int = int(v_grow)
 
         self._progress_filter: Callable[[float], float] = \
             (lambda f: f) if allow_overflow else self._filter_progress
@@ -2038,7 +2316,7 @@ class ProgressBar(Panel):
         # Set the Inner Bar
         topleft: tuple[int, int] = borders[X], borders[Y]
         bar: Shape = Shape(name='Bar', coords=topleft)
-        bar.anchor = array(TOP_LEFT)
+        bar.anchor = TOP_LEFT
         bar.color = bar_color
         bar.rect = Rect(topleft, self._inner_size)
         bar.can_draw_cell = True
@@ -2048,6 +2326,7 @@ class ProgressBar(Panel):
         # Updates the progress
         self.set_progress(self._progress)
 
+    size: ndarray = property(Panel.get_size, set_size)
     progress: float = property(get_progress, set_progress)
 
 
@@ -2163,43 +2442,61 @@ class Body(Node, ABC):
             dx - rect.width / 2) ** 2 + (dy - rect.height / 2) ** 2
         return corner_distance_squared <= radius ** 2
 
-    # @Benchmarked: tabela de dispersão mais rápida que indexação.
-    COLLISION_TABLE: list[Callable[[Shape, Shape], bool]] = {
-        (True, True): check_CC_collision,
-        (True, False): check_CR_collision,
-        (False, False): lambda shape_a, shape_b: shape_a.rect.colliderect(shape_b.rect),
-        (False, True): lambda rect, circle: Body.check_CR_collision(circle, rect),
-    }
-
     def is_colliding(self, target) -> bool:
-        ''''Verifica colisões com o corpo indicado.'''
+        ''''Verifica colisões com o corpo indicado.
+        As caixas delimitadoras dos dois corpos já foram testadas por quem chama
+        (veja `PhysicsServer._check_collisions`), então aqui só restam as formas.'''
+        # @Benchmarked: ramificação direta pelo tipo das formas é mais rápida que a
+        # tabela de dispersão (sem a tupla da chave nem o `lambda` por par).
+        check_CC: Callable[[CircleShape, CircleShape], bool] = Body.check_CC_collision
+        check_CR: Callable[[CircleShape, Shape], bool] = Body.check_CR_collision
+        target_shapes: list[Shape] = target._active_shapes
 
         for a in self._active_shapes:
-            for b in target._active_shapes:
+            # O tipo da forma é verificado uma vez, fora do laço interno.
+            if isinstance(a, CircleShape):
+                for b in target_shapes:
+
+                    if (check_CC if isinstance(b, CircleShape) else check_CR)(a, b):
+                        return True
+            else:
+                a_rect: Rect = a.rect
+
+                for b in target_shapes:
+
+                    if isinstance(b, CircleShape):
+                        if check_CR(b, a):
+                            return True
 
-                if Body.COLLISION_TABLE[
-                        isinstance(a, CircleShape),
-                        isinstance(b, CircleShape)](a, b):
-                    return True
+                    elif a_rect.colliderect(b.rect):
+                        return True
 
         return False
 
     def bounds(self) -> Rect:
-        '''Retorna a caixa delimitadora do corpo.'''
+        '''Retorna a caixa delimitadora do corpo.
+        O resultado é mantido em cache durante o passo físico atual.'''
+        epoch: int = PhysicsServer._frame_epoch
 
-        if self._was_shapes_changed:
+        if self._was_shapes_changed or self._bounds_epoch != epoch:
             self._cached_bounds = None
             self._was_shapes_changed = False
+            self._bounds_epoch = epoch
 
-        if self._cached_bounds:
+        if self._cached_bounds is not None:
             return self._cached_bounds
 
         elif self._active_shapes:
             # Calcula novas fronteiras
-            self._cached_bounds = self._active_shapes[0].rect
+            shapes: list[Shape] = self._active_shapes
 
-            for shape in self._active_shapes[1:]:
-                self._cached_bounds.union(shape.bounds())
+            if len(shapes) == 1:
+                # Apenas lida: o retângulo da forma serve como a própria caixa.
+                self._cached_bounds = shapes[0].rect
+            else:
+                # Une sobre uma cópia, para não alterar o retângulo da primeira forma.
+                self._cached_bounds = shapes[0].rect.unionall(
+                    [shape.bounds() for shape in shapes[1:]])
 
         return self._cached_bounds
 
@@ -2213,6 +2510,7 @@ class Body(Node, ABC):
         self._was_shapes_changed: bool = False
         self._bounds: Rect = None
         self._cached_bounds: Rect = None
+        self._bounds_epoch: int = -1
         self._active_shapes: list[Shape] = []
         self._layers_ids: dict[int, int] = {}
         self._colliding_bodies: list[Body] = []
@@ -2297,19 +2595,20 @@ class Popup(Panel):
         if node == self or node._parent:
             raise Node.InvalidChild
 
-        if self._children_refs.get(node.name, False):
+        if node.name in self._children_refs:
             raise Node.DuplicatedChild
 
         if at == -1:
-            self._hidden_children.append(node)
+            self._hidden_children[node] = None
         else:
-            self._hidden_children.insert(at, node)
+            # Inserção no meio: raro, reconstrói a ordem.
+            nodes: list[Node] = list(self._hidden_children)
+            nodes.insert(at, node)
+            self._hidden_children = dict.fromkeys(nodes)
 
     def remove_child(self, node: Node = None, at: int = -1) -> Node:
         node: Node = super().remove_child(node=node, at=at)
-
-        if node in self._hidden_children:
-            self._hidden_children.remove(node)
+        self._hidden_children.pop(node, None)
 
         return node
 
@@ -2335,15 +2634,19 @@ class Popup(Panel):
         if do_ease is None:
             do_ease = self._do_ease
 
-        while self._children_index[-1].name != 'BG':
-            self._hidden_children.append(
-                self.remove_child(self._children_index[-1]))
+        # O conteúdo fica após o fundo (`BG`): remove do fim, sem comparar nomes.
+        children: list[Node] = self._children_index
+        content_start: int = children.index(self.bg) + 1
+        hidden: dict[Node, None] = self._hidden_children
+
+        while len(children) > content_start:
+            hidden[self.remove_child()] = None
 
         if do_ease:
             tween: Tween = Tween(self)
             tween.tween_finished.connect(tween, self, self._on_Hide)
             tween.interpolate_attribute(
-                'size', self._size, array(VECTOR_ZERO), self.pop_duration)
+                'size', self._size, _ZERO_ARRAY, self.pop_duration)
         else:
             self._on_Hide()
 
@@ -2352,7 +2655,7 @@ class Popup(Panel):
         child: Node
 
         while self._hidden_children:
-            child = self._hidden_children.pop()
+            child, _ = self._hidden_children.popitem()
             super().add_child(child)
 
         self.popup_finished.emit()
@@ -2385,7 +2688,8 @@ class Popup(Panel):
                  bg_color: Color = colors.WHITE, borders_color: Color = colors.GRAY,
                  size: tuple[int, int] = (150, 75),
                  borders: tuple[int, int, int, int] = Panel.DEFAULT_BORDERS) -> None:
-        self._hidden_children: list[Node] = []
+        # Dicionário como pilha ordenada: pertinência em O(1) ao remover filhos.
+        self._hidden_children: dict[Node, None] = {}
         super().__init__(name=name, coords=coords, anchor=anchor, bg_color=bg_color,
                          borders_color=borders_color, size=size, borders=borders)
         self._do_ease = do_ease
@@ -2395,7 +2699,7 @@ class Popup(Panel):
         self.hided = Node.Signal(self, 'hided')
 
         if do_ease:
-            self.size = array(VECTOR_ZERO)
+            self.size = _ZERO_ARRAY
             # self.bg.rect = Rect(VECTOR_ZERO, VECTOR_ZERO)
             # self.borders.rect = Rect(VECTOR_ZERO, VECTOR_ZERO)
             # self._size = array(VECTOR_ZERO)
@@ -2405,13 +2709,41 @@ class Popup(Panel):
 
 
 # TODO -> Tornar a Label um Nó Control
+# Cache LRU das linhas renderizadas, compartilhado entre os `Label`s e `Text`s.
+# As superfícies são apenas lidas (blit), então podem ser reaproveitadas entre os nós.
+TEXT_CACHE_SIZE: int = 256
+_text_cache: dict[tuple, Surface] = {}
+
+
+def render_text(text_font: font.Font, text: str, color: Color) -> Surface:
+    '''Renderiza uma linha de texto (com antialiasing), reaproveitando as renderizações recentes.
+    Evita refazer a rasterização dos glifos ao repetir textos (trocas de cor, de idioma
+    e diálogos reabertos).'''
+    # `Color` não é "hashable": a chave usa a tupla RGBA.
+    key: tuple = (text_font, text, tuple(color))
+    surface: Surface = _text_cache.pop(key, None)
+
+    if surface is None:
+        surface = text_font.render(text, True, color)
+
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            # Descarta a entrada usada há mais tempo (a primeira inserida).
+            del _text_cache[next(iter(_text_cache))]
+
+    # (Re)insere no fim: o dicionário mantém a ordem de uso.
+    _text_cache[key] = surface
+
+    return surface
+
+
 class Label(Node):
     '''Nó usado para apresentar texto na tela.'''
     font: font.Font
 
     def set_text(self, value: str) -> None:
         self._text = value
-        self._surface = self.update_surface
+        self._cell = self.font.size(value)
+        self.update_surface()
 
     def get_text(self) -> str:
         return self._text
@@ -2420,8 +2752,8 @@ class Label(Node):
         return self._current_surface
 
     def update_surface(self) -> Surface:
-        self._current_surface = self.font.render(self.text, True, self.color)
-        self._surface = self.get_surface
+        # Renderiza na atribuição, e não no desenho, já que o texto raramente muda.
+        self._current_surface = render_text(self.font, self._text, self._color)
 
         return self._current_surface
 
@@ -2431,27 +2763,28 @@ class Label(Node):
 
         super()._draw(target_pos, target_scale, offset)
 
-        root.screen.blit(self._surface(), target_pos - offset)
+        root.screen.blit(self._current_surface, (target_pos[X] - offset[X], target_pos[Y] - offset[Y]))
 
     def get_cell(self) -> tuple[int, int]:
-        return self.font.size(self.text)
+        return self._cell
 
     def set_color(self, value: Color) -> None:
         super().set_color(value)
-        self._surface = self.update_surface
+        self.update_surface()
 
     def __init__(self, font: font.Font, name: str = 'Label', coords: tuple[int, int] = VECTOR_ZERO,
                  color: Color = colors.BLACK, text: str = '') -> None:
         super().__init__(name=name, coords=coords)
         self.font = font
-        self.color = color
-        self.anchor = array(TOP_LEFT)
+        self._color = color
+        self.anchor = TOP_LEFT
 
         self._current_surface: Surface
-        self._surface: Callable = self.update_surface
+        self._cell: tuple[int, int]
         self._text: str
         self.set_text(text)
 
+    color: Color = property(Entity.get_color, set_color)
     text: str = property(get_text, set_text)
 
 
@@ -2459,71 +2792,77 @@ class Text(Control):
     text_changed: Node.Signal
     font: font.Font
 
-    _labels: list[Label]
+    _lines: list[str]
     _text: str = ''
 
     def set_text(self, *text: str) -> None:
         txt: str = ''.join(text)
-        newlines: deque[tuple[int, int]] = deque()
         self._text = txt
 
-        for label in self._labels:
-            self.remove_child(label)
-        self._labels = []
-
-        # Search for `\n` (newlines)
-        matches: Iterator[Match] = re.finditer('[\n]', txt)
-        match: Match
-        parser_index: int = 0
-
-        for match in matches:
-            newlines.append((parser_index, match.start()))
-            parser_index = match.end()
-
-        if len(txt) > parser_index:
-            newlines.append((parser_index, len(txt)))
-
-        line_id: int = 0
-        current_offset: tuple[int, int] = VECTOR_ZERO
-        area: Rect = Rect(VECTOR_ZERO, VECTOR_ZERO)
+        # Quebra as linhas apenas em `\n` (`splitlines` também quebraria em `\r`, `\x0c`,
+        # `\u2028`...), sem gerar uma linha vazia ao final.
+        lines: list[str] = txt.split('\n')
 
-        while newlines:
-            # Make line
-            span: tuple[int, int] = newlines.popleft()
+        if not lines[-1]:
+            lines.pop()
 
-            label: Label = Label(self.font, name=f'Label{line_id}', coords=(
-                0, current_offset[Y]), color=self.color, text=txt[span[0]:span[1]])
-            area = area.union(Rect((0, current_offset[Y]), label.get_cell()))
-            current_offset += array(label.get_cell())
-            self._labels.append(label)
-            self.add_child(label)
-            line_id += 1
+        self._lines = lines
+        self._render_lines()
+        area: tuple[int, int] = self._current_surface.get_size()
 
         # Desloca o texto de acordo com a âncora da caixa de texto
-        for label in self._labels:
-            label.position = array(label.position) - \
-                array(area.size, dtype=int) * self.anchor
+        self._text_offset = tuple((array(area, dtype=int) * self._anchor).tolist())
 
-        self.size = area.size
+        self.size = area
         self.text_changed.emit()
 
     def get_text(self) -> str:
         return self._text
 
+    def _render_lines(self) -> None:
+        '''Renderiza todas as linhas numa única superfície, desenhada de uma só vez.'''
+        text_font: font.Font = self.font
+        color: Color = self._color
+        lines: list[str] = self._lines
+        # As alturas variam entre as linhas, de acordo com os glifos de cada uma.
+        cells: list[tuple[int, int]] = [self.font.size(line) for line in lines]
+        surface: Surface = Surface(
+            (max(cell[X] for cell in cells) if cells else 0,
+             sum(cell[Y] for cell in cells)), SRCALPHA)
+        line_y: int = 0
+
+        for line, cell in zip(lines, cells):
+            surface.blit(render_text(text_font, line, color), (0, line_y))
+            line_y += cell[Y]
+
+        self._current_surface = surface
+
+    def _draw(self, target_pos: tuple[int, int], target_scale: tuple[float, float],
+              offset: tuple[int, int]) -> None:
+        global root
+
+        super()._draw(target_pos, target_scale, offset)
+        text_offset: tuple[float, float] = self._text_offset
+
+        root.screen.blit(self._current_surface, (
+            target_pos[X] - text_offset[X], target_pos[Y] - text_offset[Y]))
+
     def set_color(self, value: Color) -> None:
         super().set_color(value)
-
-        for label in self._labels:
-            label.set_color(value)
+        self._render_lines()
 
     def __init__(self, font: font.Font, name: str = 'Text', coords: tuple[int, int] = VECTOR_ZERO,
                  anchor: tuple[int, int] = TOP_LEFT, color: Color = colors.BLACK) -> None:
         super().__init__(name=name, coords=coords, anchor=anchor)
         self.text_changed = Node.Signal(self, 'text_changed')
-        self._labels = []
+        self._lines = []
+        self._text_offset: tuple[float, float] = VECTOR_ZERO
+        self._current_surface: Surface
         self.font = font
         self.set_color(color)
 
+    color: Color = property(Entity.get_color, set_color)
+
 
 class BaseButton(Control):
     HOLD_EVENT: str = 'hold'
@@ -2533,31 +2872,29 @@ class BaseButton(Control):
     is_pressed: bool = False
     label: Text
     _rect: Rect
+    _is_rect_dirty: bool = True
+    _highlight_color: Color = colors.CYAN
+    _focus_color: Color = colors.BLUE
 
     def _process(self) -> None:
+        # A área de clique só é recalculada quando alguma dependência muda (veja `_update_rect`).
+        self._update_rect()
         self._mouse_input()
 
     def _input_event(self, event: InputEvent) -> None:
+        # Desvio direto pela tag: sem criar funções aninhadas e um dicionário a cada evento.
+        tag: str = event.tag
 
-        def hold() -> None:
-            global root
-            nonlocal self
+        if tag is BaseButton.HOLD_EVENT:
 
-            if self._rect.collidepoint(mouse.get_pos()):
+            if self._rect.collidepoint(root._mouse_pos):
                 self._hold()
 
-        def release() -> None:
-            global root
-            nonlocal self
+        elif tag is BaseButton.RELEASE_EVENT and self.is_pressed:
 
-            if self.is_pressed and self._rect.collidepoint(mouse.get_pos()):
+            if self._rect.collidepoint(root._mouse_pos):
                 self._release()
 
-        {
-            BaseButton.HOLD_EVENT: hold,
-            BaseButton.RELEASE_EVENT: release,
-        }[event.tag]()
-
     def _release(self) -> None:
         global root
         self._pressed()
@@ -2591,13 +2928,41 @@ class BaseButton(Control):
         '''Método virtual chamado enquanto o botão está sendo pressionado'''
 
     def _update_rect(self) -> None:
-        area: ndarray = array(self.get_cell()) * self.scale
-        self._rect.topleft = self.position - area * self.anchor
-        self._rect.size = area
+        '''Recalcula a área de clique do botão, se alguma de suas dependências
+        (posição, tamanho, escala ou âncora) tiver sido alterada desde o último cálculo.
+        Note que alterações "in-place" no vetor de `position` não são detectadas.'''
+
+        if not self._is_rect_dirty:
+            return
+
+        self._is_rect_dirty = False
+        # Aritmética escalar: evita alocar vetores do NumPy para apenas 2 elementos.
+        cell_x, cell_y = self.get_cell()
+        scale_x, scale_y = self._scale
+        anchor_x, anchor_y = self._anchor
+        pos_x, pos_y = self.position
+        area_x: float = cell_x * scale_x
+        area_y: float = cell_y * scale_y
+
+        self._rect.topleft = pos_x - area_x * anchor_x, pos_y - area_y * anchor_y
+        self._rect.size = area_x, area_y
 
     def set_anchor(self, value: tuple[int, int]) -> None:
         super().set_anchor(value)
         self.label.anchor = value
+        self._is_rect_dirty = True
+
+    def set_position(self, value: ndarray) -> None:
+        self._position = value
+        self._is_rect_dirty = True
+
+    def set_size(self, value: tuple[int, int]) -> None:
+        super().set_size(value)
+        self._is_rect_dirty = True
+
+    def set_scale(self, value: ndarray) -> None:
+        super().set_scale(value)
+        self._is_rect_dirty = True
 
     def set_is_on_focus(self, value: bool) -> None:
         if value:
@@ -2613,6 +2978,26 @@ class BaseButton(Control):
     def get_is_on_focus(self) -> bool:
         return self._is_on_focus
 
+    @cached_property
+    def _focused_highlight_color(self) -> Color:
+        '''Cor de destaque enquanto em foco. Calculada no primeiro uso e descartada
+        quando `highlight_color` ou `focus_color` são reatribuídas.'''
+        return self._highlight_color.lerp(self._focus_color, .5)
+
+    def set_highlight_color(self, value: Color) -> None:
+        self._highlight_color = value
+        self.__dict__.pop('_focused_highlight_color', None)
+
+    def get_highlight_color(self) -> Color:
+        return self._highlight_color
+
+    def set_focus_color(self, value: Color) -> None:
+        self._focus_color = value
+        self.__dict__.pop('_focused_highlight_color', None)
+
+    def get_focus_color(self) -> Color:
+        return self._focus_color
+
     def __init__(self, font: font.Font, name: str = 'BaseButton',
                  coords: tuple[int, int] = VECTOR_ZERO, anchor: tuple[int, int] = TOP_LEFT,
                  size: tuple[int, int] = None, padding: tuple[int, int] = (20, 5),
@@ -2625,7 +3010,8 @@ class BaseButton(Control):
         self.label.set_text(text)
 
         if size is None:
-            self.size = array(self.label.size) + array(padding) * 2
+            label_w, label_h = self.label.size
+            self.size = label_w + padding[X] * 2, label_h + padding[Y] * 2
 
         super().__init__(name=name, coords=coords, anchor=anchor)
         self.pressed = Node.Signal(self, 'pressed')
@@ -2645,34 +3031,46 @@ class BaseButton(Control):
             self, MOUSEBUTTONUP, Input.Mouse.LEFT_CLICK, BaseButton.RELEASE_EVENT)
         self._update_rect()
 
+    position: ndarray = property(lambda self: self._position, set_position)
+    size: tuple[int, int] = property(Control.get_size, set_size)
+    scale: ndarray = property(Entity.get_scale, set_scale)
+    anchor: tuple[int, int] = property(Entity.get_anchor, set_anchor)
     is_on_focus: bool = property(get_is_on_focus, set_is_on_focus)
+    highlight_color: Color = property(get_highlight_color, set_highlight_color)
+    focus_color: Color = property(get_focus_color, set_focus_color)
 
 
 class Link(BaseButton):
     normal_color: Color = colors.BLUE
     pressed_color: Color = colors.GREEN
-    highlight_color: Color = colors.CYAN
-    focus_color: Color = colors.PURPLE
+    _focus_color: Color = colors.PURPLE
 
     def _on_hold(self) -> None:
         self.set_color(self.pressed_color)
 
     def _focused_mouse_input(self) -> None:
 
-        if self._rect.collidepoint(mouse.get_pos()):
-            self.set_color(self.highlight_color.lerp(self.focus_color, .5))
+        if self._rect.collidepoint(root._mouse_pos):
+            self._shift_color(self._focused_highlight_color)
         else:
-            self.set_color(self.focus_color)
+            self._shift_color(self.focus_color)
 
     def _unfocused_mouse_input(self) -> None:
-        self._update_rect()
 
-        if self._rect.collidepoint(mouse.get_pos()):
-            self.set_color(self.highlight_color)
+        if self._rect.collidepoint(root._mouse_pos):
+            self._shift_color(self.highlight_color)
         else:
-            self.set_color(self.normal_color)
+            self._shift_color(self.normal_color)
+
+    def _shift_color(self, value: Color) -> None:
+        '''Aplica a cor apenas se for diferente da atual.
+        Evita renderizar novamente o texto do link a cada frame.'''
+        if value != self._color:
+            self.set_color(value)
 
     def open_link(self) -> None:
+        # Importado sob demanda: o módulo é pesado e só é usado ao abrir um link.
+        import webbrowser
         webbrowser.open(self._action)
 
     def set_color(self, value: Color) -> None:
@@ -2722,23 +3120,30 @@ class TextureButton(BaseButton):
 
     def _focused_mouse_input(self) -> None:
 
-        if self._rect.collidepoint(mouse.get_pos()):
-            self._icon.set_texture(self.highlight_icon_id)
+        if self._rect.collidepoint(root._mouse_pos):
+            self._shift_icon(self.highlight_icon_id)
         else:
-            self._icon.set_texture(self.focus_icon_id)
+            self._shift_icon(self.focus_icon_id)
 
     def _unfocused_mouse_input(self) -> None:
 
-        if self._rect.collidepoint(mouse.get_pos()):
-            self._icon.set_texture(self.hover_icon_id)
+        if self._rect.collidepoint(root._mouse_pos):
+            self._shift_icon(self.hover_icon_id)
         else:
-            self._icon.set_texture(self.normal_icon_id)
+            self._shift_icon(self.normal_icon_id)
+
+    def _shift_icon(self, id: int) -> None:
+        '''Aplica a textura apenas se for diferente da atual.
+        Evita refazer a rotação/ espelhamento do ícone a cada frame.'''
+        if id != self._icon.texture_id:
+            self._icon.set_texture(id)
 
     def _update_rect(self) -> None:
-        label_size: tuple[int, int] = self.label.get_cell()
-        icon_size: tuple[int, int] = self._sprite.get_cell()
-        self.size = max(label_size[X], icon_size[X]), max(
-            label_size[Y], icon_size[Y])
+        label_w, label_h = self.label.get_cell()
+        icon_w, icon_h = self._sprite.get_cell()
+        # Comparações diretas: dispensam as chamadas de `max` e as indexações.
+        self.size = (label_w if label_w >= icon_w else icon_w,
+                     label_h if label_h >= icon_h else icon_h)
         super()._update_rect()
 
     def __init__(self, font: font.Font, textures: list[Surface], name: str = 'TextureButton',
@@ -2749,8 +3154,10 @@ class TextureButton(BaseButton):
         self._icon = Icon(textures)
         self._sprite = Sprite(atlas=self._icon)
         self._update_rect()
-        self._sprite.position = array(
-            (0, self.label.get_cell()[X])) - self.get_cell() * self.anchor
+        cell_w, cell_h = self.get_cell()
+        anchor_x, anchor_y = self._anchor
+        self._sprite.position = (
+            -cell_w * anchor_x, self.label.get_cell()[X] - cell_h * anchor_y)
 
         if not textures:
             raise TextureButton.NoTexture
@@ -2764,6 +3171,14 @@ class TextureButton(BaseButton):
 
 
 class RichTextLabel(Control):
+    # Busca por
+    # `<a = path/link/or/event > ... <\a>` (links) or
+    # <img = path/to/icon /> (icons)
+    # Os grupos nomeados indicam o tipo da seção (`match.lastgroup`),
+    # e `link_text` captura o texto interno do link.
+    TAGS_PATTERN: re.Pattern = re.compile(
+        r'(?P<link><a[^>]*>(?P<link_text>.*?)</a\s*>)|(?P<icon><img[^>]*>.*?</img\s*>)')
+
     default_font: font.Font
     fonts: dict[str, font.Font]
 
@@ -2780,88 +3195,40 @@ class RichTextLabel(Control):
             child.free()
 
         txt: str = ''.join(text)
-        metadata: deque[dict[str, ]] = deque()
-
-        # Busca por
-        # `<a = path/link/or/event > ... <\a>` (links) or
-        # <img = path/to/icon /> (icons)
-        matches: Iterator[Match] = re.finditer(
-            r'(<a.*>.*</a[ ]*>)|(<img.*>.*</img[ ]*>)', txt)
-
-        def filter(match: Match) -> str:
-            meta: str
-
-            # TODO -> Adicionar dados anexos
-            for tag, dtype in {'<a': 'link', '<img': 'icon'}.items():
-                if txt[match.start():match.end()].startswith(tag):
-                    meta = dtype
-                    break
-
-            return meta
-
-        def add_text(start: int, end: int) -> None:
-            nonlocal metadata
-            metadata.append({'type': 'text', 'span': (start, end)})
+        # Seções como tuplas `(tipo, intervalo, correspondência)`, percorridas em ordem.
+        sections: list[tuple[str, tuple[int, int], Match]] = []
 
+        matches: Iterator[Match] = RichTextLabel.TAGS_PATTERN.finditer(txt)
         parser_index: int = 0
         match: Match
         # Divide as seções de acordo com as correspondências
         for match in matches:
             if match.start() != parser_index:
-                add_text(parser_index, match.start())
+                sections.append(('text', (parser_index, match.start()), None))
 
             span: tuple[int, int] = match.span()
-            metadata.append({'type': filter(match), 'span': span})
+            # TODO -> Adicionar dados anexos
+            sections.append((match.lastgroup, span, match))
             parser_index = span[1]
 
         if len(txt) > parser_index:
-            add_text(parser_index, len(txt))
+            sections.append(('text', (parser_index, len(txt)), None))
 
         # Processa o layout/ aparência de cada seção do texto
-        section_id: int = 0
         current_offset: tuple[int, int] = VECTOR_ZERO
-        current_color: Color = self.color
-        current_font: font.Font = self.default_font
+        # Área única, expandida no lugar (`union_ip`) a cada seção.
         area: Rect = Rect(VECTOR_ZERO, VECTOR_ZERO)
 
-        def add_text(i: int, span: tuple[int, int]) -> Node:
-            nonlocal self, txt, current_font, current_color, current_offset, area
-
-            text: Text = Text(current_font, name=f'Text{i}', coords=(
-                0, current_offset[Y]), anchor=self.anchor, color=current_color)
-            text.set_text(txt[span[0]:span[1]])
-            self._content.append(text)
-            self.add_child(text)
-            area = area.union(Rect((0, current_offset[Y]), text.get_cell()))
-            current_offset = text.position + text.size
-
-        def add_link(i: int, span: tuple[int, int]) -> None:
-            nonlocal self, txt, current_font, current_color, current_offset
-            text: str = txt[span[0]:span[1]]
-            open_tag: Match = re.search(r'>', text)
-            close_tag: Match = re.search(r'</a[ ]*>', text)
-
-            link: Link = Link(
-                current_font, name=f'Link{i}', coords=(0, current_offset[Y]),
-                anchor=self.anchor, text=text[open_tag.end():close_tag.start()])
-            self._content.append(link)
-            self.add_child(link)
-            area.union(Rect((0, current_offset[Y]), link.get_cell()))
-            current_offset = link.position + link.size
-
-        def add_icon(i: int, to_pos: tuple[int, int]) -> None:
-            # TODO
-            #icon: Icon()
-            pass
+        for section_id, (content_type, span, match) in enumerate(sections):
 
-        while metadata:
-            content: dict[str, ] = metadata.popleft()
-            {
-                'text': add_text,
-                'link': add_link,
-                'icon': add_icon,
-            }[content['type']](section_id, content['span'])
-            section_id += 1
+            if content_type == 'text':
+                current_offset, area = self._add_text(
+                    section_id, txt[span[0]:span[1]], current_offset, area)
+            elif content_type == 'link':
+                current_offset, area = self._add_link(
+                    section_id, match['link_text'], current_offset, area)
+            else:
+                self._add_icon(section_id, span)
 
         # Desloca o conteúdo de acordo com a âncora da caixa de texto
         # for item in self._content:
@@ -2869,6 +3236,38 @@ class RichTextLabel(Control):
 
         self.size = area.size
 
+    def _add_text(self, i: int, text: str, offset: tuple[int, int],
+                  area: Rect) -> tuple[tuple[int, int], Rect]:
+        '''Adiciona uma seção de texto simples ao conteúdo.
+        Retorna o deslocamento e a área atualizados.'''
+        section: Text = Text(self.default_font, name=f'Text{i}', coords=(
+            0, offset[Y]), anchor=self.anchor, color=self.color)
+        section.set_text(text)
+        self._content.append(section)
+        self.add_child(section)
+        area.union_ip((0, offset[Y]), section.get_cell())
+
+        return section.position + section.size, area
+
+    def _add_link(self, i: int, text: str, offset: tuple[int, int],
+                  area: Rect) -> tuple[tuple[int, int], Rect]:
+        '''Adiciona uma seção de link ao conteúdo.
+        Recebe o texto interno do link, já extraído pela busca das tags.
+        Retorna o deslocamento e a área atualizados.'''
+        link: Link = Link(
+            self.default_font, name=f'Link{i}', coords=(0, offset[Y]),
+            anchor=self.anchor, text=text)
+        self._content.append(link)
+        self.add_child(link)
+        area.union_ip((0, offset[Y]), link.get_cell())
+
+        return link.position + link.size, area
+
+    def _add_icon(self, i: int, span: tuple[int, int]) -> None:
+        # TODO
+        #icon: Icon()
+        pass
+
     def get_rich_text(self) -> str:
         return self._text
 
@@ -2883,8 +3282,6 @@ class RichTextLabel(Control):
 
 class Button(BaseButton):
     normal_color: Color = colors.WHITE
-    highlight_color: Color = colors.CYAN
-    focus_color: Color = colors.BLUE
     pressed_color: Color = colors.GREEN
 
     pressed: Node.Signal
@@ -2896,15 +3293,14 @@ class Button(BaseButton):
 
     def _unfocused_mouse_input(self) -> None:
 
-        if self._rect.collidepoint(mouse.get_pos()):
+        if self._rect.collidepoint(root._mouse_pos):
             self.panel.bg.color = self.highlight_color
         else:
             self.panel.bg.color = self.normal_color
 
     def _focused_mouse_input(self) -> None:
-        if self._rect.collidepoint(mouse.get_pos()):
-            self.panel.bg.color = self.highlight_color.lerp(
-                self.focus_color, .5)
+        if self._rect.collidepoint(root._mouse_pos):
+            self.panel.bg.color = self._focused_highlight_color
         else:
             self.panel.bg.color = self.focus_color
 
@@ -2913,7 +3309,10 @@ class Button(BaseButton):
         self.panel.set_anchor(value)
 
     def _on_Label_text_changed(self) -> None:
-        self.size = array(self.label.size) + array(self._padding) * 2
+        # Aritmética escalar: dispensa os `ndarray`s intermediários de 2 elementos.
+        label_w, label_h = self.label.size
+        padding_x, padding_y = self._padding
+        self.size = label_w + padding_x * 2, label_h + padding_y * 2
         self.panel.size = self.size
         self._update_rect()
 
@@ -2937,6 +3336,8 @@ class Button(BaseButton):
         self.label.connect(self.label.text_changed, self,
                            self._on_Label_text_changed)
 
+    anchor: tuple[int, int] = property(Entity.get_anchor, set_anchor)
+
 
 class PopupDialog(Popup):
     label: RichTextLabel
@@ -2977,6 +3378,16 @@ class PhysicsServer():
     '''Singleton responsável pelo registro de corpos físicos
     (colisores) e tratamento das colisões entre eles.'''
     _instance = None
+    _is_initialized: bool = False
+    # @Benchmarked: com `Rect.collidelistall`, a verificação direta é mais
+    # barata que a varredura ordenada até por volta de 100 x 100 pares.
+    BROADPHASE_MIN_PAIRS: int = 100 * 100
+    # Contador de passos físicos, usado para invalidar o cache de `Body.bounds()`.
+    _frame_epoch: int = 0
+    # Durante a verificação das colisões os espaços estão sendo percorridos: os corpos
+    # liberados nesse intervalo (por respostas às colisões) são removidos ao fim do passo.
+    _is_dispatching: bool = False
+    _freed_bodies: dict[Body, type[Body]] = {}
 
     '''Um objeto físico serve de contêiner para outros objetos físicos.
     No caso do nó do tipo `Body`, este contém listas ordenadas (de acordo
@@ -2984,115 +3395,192 @@ class PhysicsServer():
     descendentes que são do tipo `Body`.'''
 
     class PhysicsSpace(Generic[T]):
+        __slots__ = ('masks', 'layers')
+
+        # Dicionários usados como conjuntos ordenados: remoção em O(1),
+        # mantendo a ordem de inserção na verificação das colisões.
         def __init__(self) -> None:
-            self.masks: list[T] = []  # Espaço que gera colisões.
-            self.layers: list[T] = []  # Espaço que recebe colisões.
+            self.masks: dict[T, None] = {}  # Espaço que gera colisões.
+            self.layers: dict[T, None] = {}  # Espaço que recebe colisões.
 
     def _on_Body_freed(self, _type: type[Body], body: Body) -> None:
-        '''Remove um nó dos registros do espaço físico.'''
-        # WATCH -> Adicionar uma fila de remoção para prevenir bugs?
+        '''Remove um nó dos registros do espaço físico.
+        Se liberado durante a verificação das colisões, a remoção é adiada para o fim do passo.'''
+        body.disconnect(body.freed, self)
+
+        if PhysicsServer._is_dispatching:
+            PhysicsServer._freed_bodies[body] = _type
+        else:
+            self._remove_body(body, _type)
+
+    def _remove_body(self, body: Body, _type: type[Body]) -> None:
+        '''Remove o corpo das camadas e máscaras do seu espaço físico.'''
         _PS: type = PhysicsServer.PhysicsSpace
         layers: list[int] = PhysicsServer.get_bitflags(body.collision_layer)
         masks: list[int] = PhysicsServer.get_bitflags(body.collision_mask)
         space: list[_PS[Body]] = self.MATCH[_type]
-        body.disconnect(body.freed, self)
 
         # Remove o corpo das camadas selecionadas.
         for layer in layers:
-            space[int(log2(layer))].layers.remove(body)
+            del space[layer.bit_length() - 1].layers[body]
 
         # Remove o corpo das máscaras selecionadas.
         for mask in masks:
-            space[int(log2(mask))].masks.remove(body)
+            del space[mask.bit_length() - 1].masks[body]
 
     def process_collisions(self) -> None:
-
+        # Invalida as caixas delimitadoras em cache do passo anterior.
+        PhysicsServer._frame_epoch += 1
+        check: Callable[[dict[Body, None], dict[Body, None]], None] = \
+            PhysicsServer._check_collisions
+        static_bodies: list[PhysicsServer.PhysicsSpace[StaticBody]] = self.static_bodies
+        PhysicsServer._is_dispatching = True
+
+        # Espaços sem máscaras ou sem camadas não geram colisões: são descartados
+        # aqui, sem a chamada (e as listas de trabalho) de `_check_collisions`.
         for space in self.areas:
             # Colisão entre áreas
-            PhysicsServer._check_collisions(space.masks, space.layers)
+            if space.masks and space.layers:
+                check(space.masks, space.layers)
+
+        # Indexação direta, evitando as cópias das fatias da lista.
+        min_len: int = min(len(self.kinematic_bodies), len(static_bodies))
+        for i, space in enumerate(self.kinematic_bodies):
+            layers: dict[Body, None] = space.layers
+
+            if not layers:
+                continue
 
-        min_len: int = min(len(self.kinematic_bodies), len(self.static_bodies))
-        for i, space in enumerate(self.kinematic_bodies[:min_len]):
             # Colisão entre corpos dinâmicos
-            PhysicsServer._check_collisions(space.masks, space.layers)
-            # Colisão com corpo estático
-            PhysicsServer._check_collisions(
-                self.static_bodies[i].masks, space.layers)
-            # PhysicsServer._check_collisions(space.masks, self.static_bodies[i].layers)
-            # WATCH -> Permite que o corpo estático receba colisões.
+            if space.masks:
+                check(space.masks, layers)
+
+            if i < min_len and static_bodies[i].masks:
+                # Colisão com corpo estático
+                check(static_bodies[i].masks, layers)
+                # check(space.masks, static_bodies[i].layers)
+                # WATCH -> Permite que o corpo estático receba colisões.
 
-        # Colisões restantes
-        for space in self.kinematic_bodies[min_len:]:
-            PhysicsServer._check_collisions(space.masks, space.layers)
+        PhysicsServer._is_dispatching = False
+        # Remove os corpos liberados durante as respostas às colisões.
+        freed: dict[Body, type[Body]] = PhysicsServer._freed_bodies
+
+        while freed:
+            self._remove_body(*freed.popitem())
 
     def insert_body(self, body: Body, _type: type[Body]) -> None:
         '''Insere um nó ordenadamente nos registros do espaço físico.'''
         # bounds: Rect = body.bounds()
         _PS: type = PhysicsServer.PhysicsSpace
-        layers: list[int] = PhysicsServer.get_bitflags(body.collision_layer)
-        masks: list[int] = PhysicsServer.get_bitflags(body.collision_mask)
+        # Índices dos espaços de cada bit, calculados uma única vez.
+        layers_ids: list[int] = [
+            layer.bit_length() - 1 for layer in PhysicsServer.get_bitflags(body.collision_layer)]
+        masks_ids: list[int] = [
+            mask.bit_length() - 1 for mask in PhysicsServer.get_bitflags(body.collision_mask)]
         space: list[_PS[Body]] = self.MATCH[_type]
         body.connect(body.freed, self, self._on_Body_freed, _type)
 
-        if layers:
-            space_max: int = len(space) - 1
-            _higher_layer: int = int(log2(layers[-1]))
-            # Se a camada maior ao qual o corpo será adicionado for um valor
-            # maior do que o espaço existente, mais espaço é adicionado.
-            if _higher_layer > space_max:
-                new_layers: int = _higher_layer - space_max
+        # Se a maior camada (ou máscara) ao qual o corpo será adicionado for um valor
+        # maior do que o espaço existente, mais espaço é adicionado de uma só vez.
+        needed: int = max(layers_ids[-1] if layers_ids else -1,
+                          masks_ids[-1] if masks_ids else -1) + 1 - len(space)
 
-                for _ in range(new_layers):
-                    space.append(_PS())
+        if needed > 0:
+            space.extend([_PS() for _ in range(needed)])
 
-            # Insere o corpo às camadas selecionadas.
-            for layer in layers:
-                space[int(log2(layer))].layers.append(body)
+        # Insere o corpo às camadas selecionadas.
+        for i in layers_ids:
+            space[i].layers[body] = None
 
-        if masks:
-            space_max: int = len(space) - 1
-            _higher_mask: int = int(log2(masks[-1]))
+        # Insere o corpo às máscaras selecionadas.
+        for i in masks_ids:
+            space[i].masks[body] = None
 
-            if _higher_mask > space_max:
-                new_masks: int = _higher_mask - space_max
+    @staticmethod
+    def _check_collisions(masks: dict[Body, None], layers: dict[Body, None]):
 
-                for _ in range(new_masks):
-                    space.append(_PS())
+        if not masks or not layers:
+            return
 
-            # Insere o corpo às máscaras selecionadas.
-            for mask in masks:
-                space[int(log2(mask))].masks.append(body)
+        # Cópias dos espaços: as respostas às colisões podem inserir (ou liberar) corpos.
+        # Vetores paralelos (corpos e caixas), sem a criação de tuplas por elemento.
+        mask_bodies: list[Body] = list(masks)
+        layer_bodies: list[Body] = list(layers)
+        layer_rects: list[Rect] = [layer.bounds() for layer in layer_bodies]
+        # Corpos liberados neste passo: ainda nas cópias, mas não colidem mais.
+        freed: dict[Body, type[Body]] = PhysicsServer._freed_bodies
+
+        if len(mask_bodies) * len(layer_rects) <= PhysicsServer.BROADPHASE_MIN_PAIRS:
+            # Verifica as combinações de elementos.
+            # O teste das caixas delimitadoras é feito em lote, pelo PyGame.
+            # Máscaras fora da caixa que envolve todas as camadas são descartadas
+            # com um único teste, antes do lote.
+            # @Benchmarked: com as camadas agrupadas, o passo fica ~4x mais rápido;
+            # com tudo espalhado pela tela, o custo extra é de ~3%.
+            layers_bounds: Rect = layer_rects[0].unionall(layer_rects)
+
+            for mask in mask_bodies:
+                m_bounds: Rect = mask.bounds()
+
+                if not m_bounds.colliderect(layers_bounds):
+                    continue
+
+                for i in m_bounds.collidelistall(layer_rects):
+                    layer: Body = layer_bodies[i]
+
+                    # A fila está quase sempre vazia: só então as buscas são feitas.
+                    if freed:
+                        if mask in freed:
+                            break
+
+                        if layer in freed:
+                            continue
+
+                    if mask.is_colliding(layer):
+                        layer._collide(mask)
+            return
 
-    @staticmethod
-    def _check_collisions(masks: list[Body], layers: list[Body]):
-        _bounds: type = list[tuple[Body, Rect]]
-        mask_bounds: _bounds = []
-        layer_bounds: _bounds = []
+        # Fase ampla: varredura e poda no eixo X (sort and sweep).
+        # As camadas são ordenadas por `left`; como nenhuma é mais larga que `max_w`,
+        # as que podem sobrepor a máscara em X formam uma fatia contígua da ordem.
+        order: list[int] = sorted(range(len(layer_rects)), key=lambda i: layer_rects[i].x)
+        sorted_rects: list[Rect] = [layer_rects[i] for i in order]
+        lefts: list[int] = [l_bounds.x for l_bounds in sorted_rects]
+        max_w: int = max(l_bounds.w for l_bounds in sorted_rects)
+
+        for mask in mask_bodies:
+            m_bounds: Rect = mask.bounds()
+            start: int = bisect_right(lefts, m_bounds.x - max_w)
+            hits: list[int] = m_bounds.collidelistall(
+                sorted_rects[start:bisect_left(lefts, m_bounds.right)])
+
+            if not hits:
+                continue
 
-        for mask in masks:
-            mask_bounds.append((mask, mask.bounds()))
-        for layer in layers:
-            layer_bounds.append((layer, layer.bounds()))
+            # Preserva a ordem de registro das camadas na resposta das colisões.
+            for i in sorted([order[start + k] for k in hits]):
+                layer: Body = layer_bodies[i]
+
+                if freed:
+                    if mask in freed:
+                        break
+
+                    if layer in freed:
+                        continue
 
-        # Verifica as combinações de elementos.
-        for mask, m_bounds in mask_bounds:
-            for layer, l_bounds in layer_bounds:
-                if m_bounds.colliderect(l_bounds) and mask.is_colliding(layer):
+                if mask.is_colliding(layer):
                     layer._collide(mask)
 
     @staticmethod
     def get_bitflags(from_value: int) -> list[int]:
-        tmp: int = from_value
-        counter: int = 1
+        '''Retorna os bits ativos do valor, do menor para o maior.'''
         layers: list[int] = []
 
-        while tmp > 0:
-            layer: int = from_value & counter
-            counter *= 2
-
-            if layer != 0:
-                layers.append(layer)
-                tmp -= layer
+        while from_value > 0:
+            # Isola o bit ativo de menor ordem.
+            layer: int = from_value & -from_value
+            layers.append(layer)
+            from_value ^= layer
 
         return layers
 
@@ -3105,6 +3593,11 @@ class PhysicsServer():
         return cls._instance
 
     def __init__(self) -> None:
+        # `__init__` é chamado a cada `PhysicsServer()`, mesmo retornando a instância existente.
+        if self._is_initialized:
+            return
+
+        self._is_initialized = True
         _PS: type[PhysicsServer.PhysicsSpace] = PhysicsServer.PhysicsSpace
         self.areas: list[_PS[Area]] = [
             # _PS(), # Camada 1 (ímpar)
@@ -3130,8 +3623,9 @@ class PhysicsServer():
 class SceneTree(CanvasLayer):
     '''Nó singleton usado como a rais da árvore da cena.
     Definido dessa forma para facilitar acessos globais.'''
-    pause_toggled: Node.Signal
-    locale_changed: Node.Signal
+    # Sinais criados sob demanda, no primeiro acesso.
+    _pause_toggled: Node.Signal = None
+    _locale_changed: Node.Signal = None
 
     # Motor de física.
     physics_server: PhysicsServer = PhysicsServer()
@@ -3158,23 +3652,37 @@ class SceneTree(CanvasLayer):
     factor_fps: float = 0.0  # O Fator entre o fps atual e o fps fixo
     delta: float = 0.0  # O tempo decorrido desde o último frame
 
-    # Tweening
-    _active_tweens: list[Tween] = []
+    # Tweening (dicts usados como conjuntos ordenados: remoção em O(1))
+    _active_tweens: dict[Tween, None] = {}
     # Timings
-    _active_timers: list[Timer] = []
+    _active_timers: dict[Timer, None] = {}
 
     _instance = None
+    _is_initialized: bool = False
     tree_pause: int = 0
     groups: dict[str, list[Node]] = {}
     gui_font: font.Font = None
+    # Árvore de debug em cache: `(versão da árvore, listas de `_get_tree`)`.
+    _tree_cache: tuple = None
 
     _locale: str = 'en'
-    _locales: dict[str, ]
+    # Criados sob demanda, ao carregar a primeira locale.
+    _locales: dict[str, ] = None
+    _cached_locales: dict[str, dict[str, ]] = None
+    _locales_dir: str = ''
+    _locale_load_method: Callable[[str, str], dict[str, ]] = None
     _current_scene: Node = None
     _last_time: float = 0.0
+    _mouse_pos: tuple[int, int] = 0, 0
 
     FOCUS_ACTION_DOWN: str = 'focus_action_down'
     FOCUS_ACTION_UP: str = 'focus_action_up'
+    # Eventos `(input_type, key, tag)` das ações de foco, montados uma única vez.
+    FOCUS_BINDINGS: tuple[tuple[int, int, str]] = (
+        (KEYDOWN, K_RETURN, FOCUS_ACTION_UP), (KEYUP, K_RETURN, FOCUS_ACTION_DOWN),
+        (KEYDOWN, K_SPACE, FOCUS_ACTION_UP), (KEYUP, K_SPACE, FOCUS_ACTION_DOWN),
+        (KEYDOWN, K_KP_ENTER, FOCUS_ACTION_UP), (KEYUP, K_KP_ENTER, FOCUS_ACTION_DOWN),
+    )
     _current_focus: BaseButton = None
     
     # Caminhos para os diretórios de usuário
@@ -3222,50 +3730,70 @@ class SceneTree(CanvasLayer):
             push_warning('The Game needs an active scene to be able to run.')
             return
 
+        # Métodos e contêineres fixos durante toda a execução, em variáveis locais:
+        # evitam as buscas de atributos a cada frame. `screen_color` e `fixed_fps`
+        # continuam lidos a cada frame, já que as cenas podem alterá-los.
+        tick: Callable[[int], int] = self.clock.tick
+        get_fps: Callable[[], float] = self.clock.get_fps
+        fill: Callable[..., Rect] = self.screen.fill
+        input_tick: Callable[[], bool] = input._tick
+        propagate_input: Callable[[], None] = self._input
+        propagate: Callable[[], None] = self._propagate
+        draw_tree: Callable[[], None] = self._draw_tree
+        update_display: Callable[[], None] = pygame.display.update
+        process_collisions: Callable[[], None] = self.physics_server.process_collisions
+        active_timers: dict[Timer, None] = self._active_timers
+        active_tweens: dict[Tween, None] = self._active_tweens
+
         while True:
-            # tick = self.clock.tick(self.fixed_fps)
-            self.clock.tick(self.fixed_fps)
-            factor_fps: float = self.clock.get_fps() / self.fixed_fps
+            fixed_fps: int = self.fixed_fps
+            tick(fixed_fps)
+            factor_fps: float = get_fps() / fixed_fps
             self.factor_fps = factor_fps
             delta = factor_fps / 60.0
             self.delta = delta
 
-            self.screen.fill(self.screen_color)
+            fill(self.screen_color)
             # Preenche a tela
 
-            # Propaga as entradas
-            if input._tick():
-                self._input()
+            # Propaga as entradas (e atualiza a posição do mouse em cache)
+            if input_tick():
+                propagate_input()
 
-            # Processa os timers ativos na lista
-            for timer in self._active_timers:
-                timer._process(delta)
+            # Processa os timers ativos (sobre uma cópia, pois se removem ao concluir)
+            if active_timers:
+                for timer in tuple(active_timers):
+                    timer._process(delta)
 
-            # Processa os tweens ativos na lista
-            for tween in self._active_tweens:
-                tween._process(delta)
+            # Processa os tweens ativos (sobre uma cópia, pois se removem ao concluir)
+            if active_tweens:
+                for tween in tuple(active_tweens):
+                    tween._process(delta)
 
-            self._propagate()
+            propagate()
             # Propaga o processamento
 
-            self._draw_tree()
+            draw_tree()
             # Desenha a árvore.
             # `Sprite`s e `Label`s aplicam blit individualmente no método `_draw`
 
-            pygame.display.update()
+            update_display()
             # Verifica as colisões antes da próxima iteração.
-            self.physics_server.process_collisions()
+            process_collisions()
 
     def pause_tree(self, pause_mode: int = Node.PauseModes.TREE_PAUSED) -> None:
         self.tree_pause = pause_mode
-        self.pause_toggled.emit(
-            bool((pause_mode ^ self.pause_mode) & Node.PauseModes.TREE_PAUSED))
+
+        # Sem observadores, o sinal sequer foi criado.
+        if self._pause_toggled is not None:
+            self._pause_toggled.emit(
+                bool((pause_mode ^ self.pause_mode) & Node.PauseModes.TREE_PAUSED))
 
     def add_to_group(self, node: Node, group: str) -> None:
         '''Adiciona o nó a um grupo determinado.
         Se o grupo não existir, cria um novo.'''
 
-        if node in node._current_groups:
+        if group in node._current_groups:
             raise SceneTree.AlreadyInGroup
 
         nodes: list[Node] = self.groups.get(group)  # Stack
@@ -3280,20 +3808,28 @@ class SceneTree(CanvasLayer):
     def remove_from_group(self, node: Node, group: str) -> None:
         '''Remove o nó do grupo determinado.
         Remove o grupo, caso o nó seja o único elemento deste.'''
-        nodes: dict[Node, ] = self.groups.get(group)
 
-        if nodes:
-            nodes.pop(node, None)  # Remove silenciosamente
+        # A lista de grupos do nó é curta: serve de guarda antes da busca no grupo.
+        if group not in node._current_groups:
+            return  # Remove silenciosamente
+
+        nodes: list[Node] = self.groups[group]
+        nodes.remove(node)
+        node._current_groups.remove(group)
+
+        if not nodes:
+            del self.groups[group]
 
     def call_group(self, group: str, method_name: str, *args) -> deque[tuple[Node, ]]:
         '''Faz uma chamada de método em todos os nós pertencentes a um determinado grupo.
         Retorna uma fila de tuplas com os respectivos nós e seus retornos.'''
-        queue: deque[tuple[Node, ]] = deque()
+        nodes: list[Node] = self.groups.get(group)
 
-        for node in self.groups.get(group, ()).keys():
-            deque.append((node, getattr(node, method_name)(*args)))
+        if not nodes:
+            return deque()
 
-        return queue
+        call: methodcaller = methodcaller(method_name, *args)
+        return deque((node, call(node)) for node in nodes)
 
     def is_on_group(self, node: Node, group: str) -> bool:
         '''Verifica se o nó pertence a um grupo determinado.'''
@@ -3309,11 +3845,11 @@ class SceneTree(CanvasLayer):
 
     def _on_Timer_timeout(self, timer: Timer) -> None:
         timer.timeout.disconnect_all(timer)
-        self._active_timers.remove(timer)
+        del self._active_timers[timer]
 
     def create_timer(self, time: float, node: Node, callback: Callable, *args) -> None:
         timer: Timer = Timer(time)
-        self._active_timers.append(timer)
+        self._active_timers[timer] = None
         timer.timeout.connect(timer, self, self._on_Timer_timeout)
         timer.timeout.connect(timer, node, callback, *args)
 
@@ -3337,16 +3873,19 @@ class SceneTree(CanvasLayer):
 
     def set_locale(self, to: str) -> None:
 
+        if self._cached_locales is None:
+            self._cached_locales = {}
+
         if to in self._cached_locales:
             self._locales = self._cached_locales[to]
         else:
-            if self._locale:
+            if self._locale and self._locales is not None:
                 self._cached_locales[self._locale] = self._locales
 
             self._locales = self._locale_load_method(self._locales_dir, to)
 
-        if self._locale != to:
-            self.locale_changed.emit(to)
+        if self._locale != to and self._locale_changed is not None:
+            self._locale_changed.emit(to)
 
         self._locale = to
 
@@ -3356,16 +3895,29 @@ class SceneTree(CanvasLayer):
 
     def clear_cached_locales(self) -> None:
         '''Remove as locales que não estão sendo usadas da memória.'''
-        del self._cached_locales
-        self._cached_locales = {}
+        self._cached_locales = None
 
     def set_screen_size(self, value: tuple[int, int]) -> None:
         self._screen_width, self._screen_height = value
-        self._screen_rect.topleft = value
+        self._screen_rect.size = value
 
     def get_screen_size(self) -> tuple[int, int]:
         return self._screen_width, self._screen_height
 
+    def get_pause_toggled(self) -> Node.Signal:
+
+        if self._pause_toggled is None:
+            self._pause_toggled = Node.Signal(self, 'pause_toggled')
+
+        return self._pause_toggled
+
+    def get_locale_changed(self) -> Node.Signal:
+
+        if self._locale_changed is None:
+            self._locale_changed = Node.Signal(self, 'locale_changed')
+
+        return self._locale_changed
+
     # def set_current_scene(self, scene: object, *args, **kwargs) -> None:
     #     self._current_scene = scene(args, kwargs)
 
@@ -3399,94 +3951,79 @@ class SceneTree(CanvasLayer):
         return cls._instance
 
     def __init__(self, name: str = 'root', coords: tuple[int, int] = VECTOR_ZERO) -> None:
+        # `__init__` é chamado a cada `SceneTree()`, mesmo retornando a instância existente.
+        if self._is_initialized:
+            return
+
+        self._is_initialized = True
         super().__init__(name=name, coords=coords)
         self._is_on_tree = True
-        self._locales = {}
-        self._locales_dir: str = ''
-        self._cached_locales: dict[str, dict[str, ]] = {}
-        self._locale_load_method: Callable[[str, str], dict[str, ]] = None
         self._layer = self
 
-        # Events
-        self.pause_toggled = Node.Signal(self, 'pause_toggled')
-        self.locale_changed = Node.Signal(self, 'locale_changed')
-
-        for key in (K_RETURN, K_SPACE, K_KP_ENTER):
-            input.register_event(self, KEYDOWN, key, SceneTree.FOCUS_ACTION_UP)
-            input.register_event(self, KEYUP, key, SceneTree.FOCUS_ACTION_DOWN)
+        input.register_events(self, SceneTree.FOCUS_BINDINGS)
 
     # WATCH
     @Node.debug()
-    def _get_tree(self) -> dict[str, Union[Node, list[Node]]]:
-
-        def get_child(node: Node) -> Node:
-            return node._children_index[0] if node._children_index else None
-
-        # pointers
-        tree: dict[str, Union[Node, list[dict]]] = {
-            'root': self,
-            'children': []
-        }
-        next: dict[str, Union[dict, list[Node]]]
-        child = get_child(self)
-
-        if child:
-            next = {
-                'root': child,
-                'children': [],
-            }
-            tree['children'].append(next)
-        else:
-            return tree
-
-        parent: dict[str, Union[dict, list[Node]]] = tree
-        # stacks
-        previous_parent: list[dict] = [parent]
-        previous_siblings: list[list[Node]] = []
-
-        while next:
-            root: Node = next['root']
-            child = get_child(root)
-            cache: dict = next
-            next = None
-
-            if child:
-                next = {
-                    'root': child,
-                    'children': [],
-                }
-                cache['children'].append(next)
-                parent = cache
-                previous_parent.append(parent)
-                previous_siblings.append(root._children_index[1:])
+    def _get_tree(self) -> dict[str, list]:
+        '''Constrói a árvore da cena em listas paralelas, em pré-ordem: `nodes` e, para cada nó,
+        os índices do pai, do primeiro filho e do próximo irmão (`-1` se ausente).
+        Consome `iter_tree`; enquanto a árvore não muda, o resultado anterior é reaproveitado.'''
+
+        if self._tree_cache is not None and self._tree_cache[0] == self._subtree_version:
+            return self._tree_cache[1]
+
+        nodes: list[Node] = []
+        parent: list[int] = []
+        first_child: list[int] = []
+        next_sibling: list[int] = []
+        # Índice do último nó visitado em cada profundidade do caminho atual.
+        path: list[int] = []
+
+        for node, depth in self.iter_tree():
+            i: int = len(nodes)
+            nodes.append(node)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            # Descarta os níveis mais profundos: a sub-árvore anterior já foi concluída.
+            del path[depth + 1:]
+
+            if depth:
+                parent_id: int = path[depth - 1]
+                parent.append(parent_id)
+
+                if len(path) > depth:
+                    # Há um irmão anterior, do mesmo pai, nessa profundidade.
+                    next_sibling[path[depth]] = i
+                else:
+                    first_child[parent_id] = i
+            else:
+                parent.append(-1)
 
+            if len(path) > depth:
+                path[depth] = i
             else:
-                while previous_siblings:
-                    siblings: list[Node] = previous_siblings.pop()
-
-                    if siblings:
-                        sibling: Node = siblings.pop()
-                        next = {
-                            'root': sibling,
-                            'children': [get_child(sibling)],
-                        }
-                        cache = {
-                            'root': sibling,
-                            'children': [next],
-                        }
-                        parent['children'].append(cache)
-                        previous_siblings.append(siblings)
-                        break
+                path.append(i)
 
-                    parent = previous_parent.pop()
+        tree: dict[str, list] = {
+            'nodes': nodes,
+            'parent': parent,
+            'first_child': first_child,
+            'next_sibling': next_sibling,
+        }
+        self._tree_cache = self._subtree_version, tree
 
         return tree
 
     screen_size: tuple[int, int] = property(get_screen_size, set_screen_size)
+    pause_toggled: Node.Signal = property(get_pause_toggled)
+    locale_changed: Node.Signal = property(get_locale_changed)
     current_scene: Node = property(get_current_scene, set_current_scene)
 
 
 # Singletons
+# Criados na importação de propósito: os métodos deste módulo os acessam como globais
+# (que não passam pelo `__getattr__` do módulo) e os scripts do jogo os recebem via
+# `from src.core.nodes import *`, que só exporta nomes já definidos.
 input: Input = Input()  # Singleton usado na captura de inputs
 # Nó Singleton que constitui a raiz da árvore da cena.
 root: SceneTree = SceneTree()
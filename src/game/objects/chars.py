@@ -169,9 +169,6 @@ class Native(Char):
     _knock_timer: Timer = None
     _cached_move: Callable[[float], None]
 
-    def _draw(self, target_pos: tuple[int, int], target_scale: tuple[float, float], offset: tuple[int, int]) -> None:
-        return super()._draw(target_pos, target_scale, offset)
-
     def _physics_process(self, factor: float) -> None:
         self.move(factor)
 
@@ -55,7 +55,7 @@ class GroundGrid(TileMap):
         self.spawn_plant(OxTree, array(self.map_size) // 2)
 
     def _process(self) -> None:
-        tile_coords: tuple[int, int] = self.screen_to_map(*mouse.get_pos())
+        tile_coords: tuple[int, int] = self.screen_to_map(*root._mouse_pos)
         self.marker.position = tile_coords * self.tile_size * self._global_scale
         self.marker.atlas.set_texture(
             int(self.get_tile(*tile_coords).is_occupied))
@@ -93,7 +93,7 @@ class GroundGrid(TileMap):
                 # TODO -> Harvest
                 return
 
-            coords: tuple[int, int] = self.screen_to_map(*mouse.get_pos())
+            coords: tuple[int, int] = self.screen_to_map(*root._mouse_pos)
             tile: Tile = self.get_tile(*coords)
 
             if tile: